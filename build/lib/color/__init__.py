@@ -1,3 +0,0 @@
-import color.color
-
-__all__ = ["color"]
\ No newline at end of file
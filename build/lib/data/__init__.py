@@ -1 +0,0 @@
-__all__ = ["controller"]
\ No newline at end of file
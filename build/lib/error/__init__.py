@@ -1 +0,0 @@
-__all__ = ["value_error"]
\ No newline at end of file
@@ -1,3 +0,0 @@
-from . import color, data, error, geom, locations, utils
-
-__all__ = ["color", "data", "error", "geom", "locations", "utils"]
\ No newline at end of file
@@ -1,3 +0,0 @@
-from . import color
-
-__all__ = ["color"]
\ No newline at end of file
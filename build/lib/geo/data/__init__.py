@@ -1,3 +0,0 @@
-# from . import assets
-
-__all__ = ["assets"]
\ No newline at end of file
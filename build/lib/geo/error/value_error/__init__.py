@@ -1 +0,0 @@
-__all__ = ["out_of_bounds_error"]
\ No newline at end of file
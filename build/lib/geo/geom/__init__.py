@@ -1,3 +0,0 @@
-from . import assets, distance, elevation, geo_pt, line, pointable, pt, shape
-
-__all__ = ["assets", "distance", "elevation", "geo_pt", "line", "pointable", "pt", "shape"]
\ No newline at end of file
@@ -1,3 +0,0 @@
-from . import assets, location, mall, mrt, network, planning, road, school
-
-__all__ = ["assets", "location", "mall", "mrt", "network", "planning", "road", "school"]
\ No newline at end of file
@@ -1,3 +0,0 @@
-from . import assets, connection, exit, station
-
-__all__ = ["assets", "connection", "exit", "station"]
\ No newline at end of file
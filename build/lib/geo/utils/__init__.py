@@ -1,3 +0,0 @@
-from . import float
-
-__all__ = ["float"]
\ No newline at end of file
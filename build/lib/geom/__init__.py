@@ -1,9 +0,0 @@
-# import geom.distance as distance
-# import geom.elevation as elevation
-# import geom.geo_pt as geo_pt
-# import geom.line as line
-# import geom.pointable as pointable
-# import geom.pt as pt
-# import geom.shape as shape
-
-# __all__ = ["distance", "elevation", "geo_pt", "line", "pointable", "pt", "shape"]
\ No newline at end of file
@@ -1 +0,0 @@
-__all__ = ["location", "mall", "mrt", "network", "planning", "road", "school"]
\ No newline at end of file
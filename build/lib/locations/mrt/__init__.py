@@ -1 +0,0 @@
-__all__ = ["connection", "exit", "station"]
\ No newline at end of file
@@ -1 +0,0 @@
-__all__ = ["kdtree"]
\ No newline at end of file
@@ -1 +0,0 @@
-__all__ = ["float"]
\ No newline at end of file
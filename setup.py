@@ -17,8 +17,8 @@ setup(
   install_requires=[
       'pandas',
       'geopandas',
-      'numpy',
-      'shapely',
+      'numpy<2',
+      'shapely>=1.8,<2',
       'gsheets',
       'Pillow',
       'fiona'
@@ -61,7 +61,7 @@ class GeoPt(shapely.geometry.Point, Pointable):
             GeoPt: the returned GeoPt object.
         """
         return GeoPt(point.y, point.x)
-    
+
     def as_pt(self) -> pt.Pt:
         """
         Converts the GeoPt into a Pt object.
@@ -115,6 +115,9 @@ class GeoPt(shapely.geometry.Point, Pointable):
     def get_closest_point(self, *points: Optional[GeoPt]) -> Tuple[Optional[GeoPt], float]:
         """
         Based on a collection of points, find the nearest to self.
+        Candidates are compared by their squared lat-long difference, which orders them
+            the same way as get_distance_basic without taking a square root for each one.
+        Only the nearest point has its actual distance computed.
         
         Args:
             *points (Optional[GeoPt]): we will find the closest of these points to self.
@@ -122,16 +125,19 @@ class GeoPt(shapely.geometry.Point, Pointable):
         Returns:
             Tuple[Optional[GeoPt], float]: point-distance tuple.
         """
+        x, y = self.x, self.y
         nearest_point = None
-        nearest_dist = float("inf")
+        nearest_dist_sq = float("inf")
         for point in points:
             if point is not None:
-                dist = self.get_distance_basic(point)
-                if nearest_dist > dist:
-                    nearest_dist = dist
+                dx = x - point.x
+                dy = y - point.y
+                dist_sq = dx*dx + dy*dy
+                if nearest_dist_sq > dist_sq:
+                    nearest_dist_sq = dist_sq
                     nearest_point = point
         if not nearest_point:
-            return (None, nearest_dist)
+            return (None, float("inf"))
         return (nearest_point, self.get_distance(nearest_point))
     
     def move_to(self, new_x: float, new_y: float) -> GeoPt:
@@ -1,44 +1,101 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, Tuple
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from shapely import geometry
-from shapely.ops import nearest_points
 
 from .geo_pt import GeoPt
 from .pt import Pt
 from ..structures.bound import Bound
-from ..structures.kdtree import KDTree
+from ..structures.kdtree import FlatKDTree
 
-class Shape(geometry.polygon.Polygon):
+class Shape:
     """
-    This class encapsulates a Shape object, with points represented
-        as a KDTree to facilitate the finding of nearest points.
+    This class encapsulates a Shape object, with points laid out
+        as a FlatKDTree over its coordinates to facilitate the finding of nearest points.
+    The nearest point is picked by squared longitude-latitude distance, the same as KDTree,
+        and only that point is turned into a GeoPt.
+
+    A Shape is not a shapely geometry itself, and only builds its shapely polygon when a geometric query needs it.
+    contains, exterior, bounds, centroid and __geo_interface__ are passed on to that polygon,
+        and anything else shapely can do should go through Shape.polygon.
 
     Fields:
-        points: a KDTree full of points representing the Shape.
+        _xy: lat-long array of the points making up the Shape, in order.
     """
-    points: KDTree[GeoPt]
+    _xy: np.ndarray
 
-    def __init__(self, points: List[GeoPt]):
+    def __init__(self, points: Union[List[GeoPt], np.ndarray]):
         """
         Initialiser for the Shape object.
 
         Args:
-            points (List[GeoPt]): ordered list of points to be included in the shape.
+            points (Union[List[GeoPt], np.ndarray]): ordered list of points to be included in the shape,
+                or an array of lat-long pairs.
         """
-        self.points = KDTree[GeoPt]()
-        super().__init__(points)
-        if isinstance(points, list):
-            self.points.add_all(*points)
+        if isinstance(points, np.ndarray):
+            self._xy = points
+        else:
+            self._xy = np.array([(point.lat, point.lon) for point in points], dtype=np.float64).reshape(-1, 2)
 
     @staticmethod
     def from_polygon(polygon: Optional[geometry.polygon.Polygon]) -> Optional[Shape]:
         if not polygon:
             return None
         if polygon.exterior:
-            return Shape([GeoPt(coords[1], coords[0]) for coords in polygon.exterior.coords])
+            xs, ys = polygon.exterior.coords.xy
+            return Shape(np.column_stack([np.asarray(ys, dtype=np.float64), np.asarray(xs, dtype=np.float64)]))
         return None
-        
+
+    @cached_property
+    def polygon(self) -> geometry.polygon.Polygon:
+        """
+        Lazily builds the shapely polygon for the Shape.
+
+        Returns:
+            geometry.polygon.Polygon: polygon made up of the Shape's points.
+        """
+        if self.is_empty:
+            return geometry.polygon.Polygon()
+        return geometry.polygon.Polygon(self._xy[:, ::-1])
+
+    def __bool__(self) -> bool:
+        return not self.is_empty
+
+    @property
+    def __geo_interface__(self) -> Dict:
+        return self.polygon.__geo_interface__
+
+    @cached_property
+    def _tree(self) -> FlatKDTree:
+        """
+        Lazily lays a FlatKDTree out over the coordinates, with longitude as x and latitude as y.
+
+        Returns:
+            FlatKDTree: tree whose indices are rows of _xy.
+        """
+        return FlatKDTree(self._xy[:, 1], self._xy[:, 0])
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self._xy) == 0
+
+    @property
+    def exterior(self) -> geometry.polygon.LinearRing:
+        return self.polygon.exterior
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        return self.polygon.bounds
+
+    @property
+    def centroid(self) -> geometry.Point:
+        return self.polygon.centroid
+
+    def contains(self, other: geometry.base.BaseGeometry) -> bool:
+        return self.polygon.contains(other)
+
     def get_nearest(self, point: GeoPt, simple: bool=False) -> Tuple[Optional[GeoPt], float]:
         """
         Gets the nearest point of the Shape to the target.
@@ -51,30 +108,35 @@ class Shape(geometry.polygon.Polygon):
             Tuple[Optional[GeoPt], float]: point-distance pair.
         """
         if simple:
-            return (self.center, self.center.get_distance(point))
-        if not self.points:
-            nearest_point: GeoPt = Pt.from_point(nearest_points(self, point)[0]).as_geo_pt()
-            return (nearest_point, point.get_distance(nearest_point))
+            center = self.center
+            return (center, center.get_distance(point))
+        if self.is_empty:
+            return (None, float("inf"))
         if self.contains(point):
-            xy = self.points.center
-            return (GeoPt(lat=xy[1], lon=xy[0]), 0)
-        nearest = self.points.nearest(point)
-        return (nearest[0], nearest[1]) if nearest[0] else (None, float("inf"))
+            return (self.center, 0)
+        best, _ = self._tree.nearest(point.x, point.y)
+        lat, lon = self._xy[best]
+        nearest_point = GeoPt(float(lat), float(lon))
+        return (nearest_point, point.get_distance(nearest_point))
 
     def get_bounds(self) -> Bound:
-        return self.points.bound
+        if self.is_empty:
+            return Bound(float("inf"), float("-inf"), float("inf"), float("-inf"))
+        min_lat, min_lon = self._xy.min(axis=0)
+        max_lat, max_lon = self._xy.max(axis=0)
+        return Bound(float(min_lon), float(max_lon), float(min_lat), float(max_lat))
 
-    @property
+    @cached_property
     def center(self) -> GeoPt:
         """
-        Gets the center of the Shape.
-        If it is a geometry.polygon.Polygon object, then find its centroid and return that point.
-        Otherwise, just get the center.
+        Gets the center of the Shape, based on the bounds of its points.
+        If the Shape has no points, then fall back to the centroid of its polygon.
+        The bounds are only worked out on the first call, as the points of a Shape do not change.
 
         Returns:
             GeoPt: center of the shape.
         """
-        if self.points:
-            xy = self.points.center
+        if not self.is_empty:
+            xy = self.get_bounds().center
             return GeoPt(xy[1], xy[0])
-        return Pt(self.centroid.coords.x, self.centroid.coords.y).as_geo_pt()
\ No newline at end of file
+        return Pt(self.centroid.x, self.centroid.y).as_geo_pt()
@@ -19,7 +19,7 @@ from ..geom.geo_pt import GeoPt
 from ..geom.shape import Shape
 from ..structures.bound import Bound
 from ..structures.kdtree import KDTree
-from ..utils.float import is_float
+from ..utils.float import try_float
 
 class Location(GeoPt, ABC):
   """
@@ -72,8 +72,11 @@ class Location(GeoPt, ABC):
     Returns:
       Tuple[Optional[float], Optional[float]]: new lat long values.
     """
-    if lat and lon and is_float(lat) and is_float(lon):
-      return lat, lon
+    if lat and lon:
+      lat_ok, lat_value = try_float(lat)
+      lon_ok, lon_value = try_float(lon)
+      if lat_ok and lon_ok:
+        return lat_value, lon_value
     if self.shape is not None:
       return GeoPt.from_bound(Bound.get_bound_from_shape(self.shape)).coords_as_tuple_latlong()
     try:
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+from dataclasses import field
 from functools import cached_property
 from typing import Optional
 
@@ -22,6 +22,38 @@ class Platform(Location):
         self.lower_connection = None
         self.upper_connection = None
         super().__init__(name, lat=self.lat, lon=self.lon, shape=self.shape)
+
+    @staticmethod
+    def from_fields(name: str,
+                    code: platform_code.PlatformCode,
+                    lat: Optional[float],
+                    lon: Optional[float],
+                    opening_year: Optional[int],
+                    closing_year: Optional[int]) -> Platform:
+        """
+        Creates a Platform straight from its fields.
+        This skips the keyword unpacking and _try_setter loop of the initialiser,
+            which is worth it when loading every row of the fixed MRT schema.
+
+        Args:
+            name (str): name of the platform.
+            code (PlatformCode): code of the platform.
+            lat (Optional[float]): latitude of the platform.
+            lon (Optional[float]): longitude of the platform.
+            opening_year (Optional[int]): year the platform opened.
+            closing_year (Optional[int]): year the platform closed.
+
+        Returns:
+            Platform: the created platform.
+        """
+        platform = Platform.__new__(Platform)
+        platform.platform_code = code
+        platform.opening_year = opening_year
+        platform.closing_year = closing_year
+        platform.lower_connection = None
+        platform.upper_connection = None
+        Location.__init__(platform, name, lat=lat, lon=lon, shape=None)
+        return platform
         
     def __eq__(self, other: Platform):
         return self.platform_code == other.platform_code
@@ -1,6 +1,7 @@
 from __future__ import annotations
+from operator import itemgetter
 from os.path import join, dirname
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional
 
 import geopandas as gpd
 import pandas as pd
@@ -41,6 +42,21 @@ class Stations(Locations):
         "Closing Year": "closing_year",
         "Chinese": "chinese",
     }
+    _FIELD_GETTER = itemgetter(*_FIELD_MAP.keys())
+    _MAPPED_FIELDS = tuple(_FIELD_MAP.values())
+
+    _DTYPES = {
+        "Label": str,
+        "Name": str,
+        "Abbreviation": str,
+        "Opening Year": "float64",
+        "Address": str,
+        "Postcode": "float64",
+        "Lat": "float64",
+        "Long": "float64",
+        "Closing Year": "float64",
+        "Chinese": str,
+    }
 
     def __init__(self,
                  *stations: Station,
@@ -58,7 +74,9 @@ class Stations(Locations):
 
     @staticmethod
     def _get_data_handler(offline: bool) -> pd.DataFrame:
-        raw_df = pd.read_csv(join(dirname(__file__), "assets/mrt.csv"))
+        raw_df = pd.read_csv(join(dirname(__file__), "assets/mrt.csv"),
+                             usecols=list(Stations._DTYPES.keys()),
+                             dtype=Stations._DTYPES)
         return raw_df
 
     @staticmethod
@@ -66,10 +84,7 @@ class Stations(Locations):
         if blanks:
             return lambda df: df.to_dict("records")
         def clean_df(df):
-            filtered_df: pd.DataFrame = df[pd.notnull(df.Abbreviation)
-                                           & pd.notnull(df["Opening Year"])
-                                           & pd.notnull(df.Address)
-                                           & pd.notnull(df.Postcode)]
+            filtered_df: pd.DataFrame = df.dropna(subset=["Abbreviation", "Opening Year", "Address", "Postcode"])
             return filtered_df.to_dict("records")
         return clean_df
     
@@ -84,12 +99,12 @@ class Stations(Locations):
             platform_code = PlatformCode(platform_info["Label"])
             platform_info = Stations._field_map(platform_info)
             platform_info["platform_code"] = platform_code
-            # lat = platform_info.get("lat")
-            # lon = platform_info.get("lon")
-            # opening_year = platform_info.get("opening_year")
-            # closing_year = platform_info.get("closing_year")
-            # platform = Platform(platform_code, opening_year, closing_year)
-            platform = Platform(platform_code.code, **platform_info)
+            platform = Platform.from_fields(platform_code.code,
+                                            platform_code,
+                                            platform_info["lat"],
+                                            platform_info["lon"],
+                                            platform_info["opening_year"],
+                                            platform_info["closing_year"])
             if name not in station_platforms:
                 station_platforms[name] = [platform]
                 station_infos[name] = platform_info
@@ -102,6 +117,6 @@ class Stations(Locations):
 
     @staticmethod
     def _field_map(d: Dict) -> Dict:
-        for old_field, new_field in Stations._FIELD_MAP.items():
-            d[new_field] = d.pop(old_field)
-        return d
+        return dict(zip(Stations._MAPPED_FIELDS, Stations._FIELD_GETTER(d)),
+                    Name=d["Name"],
+                    Label=d["Label"])
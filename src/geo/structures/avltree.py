@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Any, Generic, List, Optional, Tuple, TypeVar
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import numpy as np
 
 from .comparable import Comparable
 
@@ -17,6 +19,8 @@ class Node(Generic[T]):
         count (int): duplicate values are captured here, so we can have nodes with >1 counts.
         weight (int): the number of nodes on the tree rooted at the node.
     """
+    __slots__ = ("key", "left", "right", "height", "count", "weight")
+
     key:    T
     left:   Optional[Node[T]]
     right:  Optional[Node[T]]
@@ -43,101 +47,190 @@ class AVLTree(Generic[T]):
             
     def __init__(self):
         self.root = None
+
+    @classmethod
+    def from_sorted(cls, keys: List[T]) -> AVLTree[T]:
+        """
+        Builds a perfectly balanced tree from keys that are already in ascending order.
+        The middle key of each sublist becomes the root of its subtree, so no rotations are needed.
+        Duplicate keys are merged into a single node with a higher count.
+
+        Args:
+            keys (List[T]): keys to be added, in ascending order.
+
+        Returns:
+            AVLTree[T]: the resulting tree.
+        """
+        tree = cls()
+        unique_keys: List[T] = []
+        counts: List[int] = []
+        for key in keys:
+            if unique_keys and not unique_keys[-1] < key:
+                counts[-1] += 1
+            else:
+                unique_keys.append(key)
+                counts.append(1)
+
+        def build(low: int, high: int) -> Optional[Node[T]]:
+            if low > high:
+                return None
+            mid = (low + high) // 2
+            node = Node[T](unique_keys[mid])
+            node.count = counts[mid]
+            node.left = build(low, mid-1)
+            node.right = build(mid+1, high)
+            tree.set_height(node)
+            tree.set_weight(node)
+            return node
+        tree.root = build(0, len(unique_keys)-1)
+        return tree
+
+    @classmethod
+    def from_unsorted(cls, keys: List[T]) -> AVLTree[T]:
+        """
+        Sorts the keys once, then builds a balanced tree out of them.
+
+        Args:
+            keys (List[T]): keys to be added, in any order.
+
+        Returns:
+            AVLTree[T]: the resulting tree.
+        """
+        return cls.from_sorted(sorted(keys))
     
     def insert(self, key: T) -> None:
         """
         Inserts a key to the tree, triggering rotations.
         If the key already exists, then increment the key's count.
         Must be comparable or else the < > operators won't work.
+        The descent is done iteratively, keeping the path taken on a stack
+            so that heights and weights can be fixed on the way back up.
 
         Args:
             key (T): key to be added.
         """
-        def insert_helper(node: Optional[Node[T]], key: T) -> Optional[Node[T]]:
-            if not node:
-                return Node[T](key)
-            elif key < node.key:
-                node.left = insert_helper(node.left, key)
-            elif key > node.key:
-                node.right = insert_helper(node.right, key)
+        stack: List[Tuple[Node[T], bool]] = []
+        node = self.root
+        while node:
+            if key < node.key:
+                stack.append((node, True))
+                node = node.left
+            elif node.key < key:
+                stack.append((node, False))
+                node = node.right
             else:
                 node.count += 1
-            self.set_height(node)
-            self.set_weight(node)
-            
-            balance = self.get_balance(node)
-            
-            left_key = self.get_key(node.left)
-            right_key = self.get_key(node.right)
-
-            if balance > 1 and key < left_key:
-                return self.right_rotate(node)
-            if balance < -1 and right_key and key > right_key:
-                return self.left_rotate(node)
-            if balance > 1 and left_key and key > left_key:
-                node.left = self.left_rotate(node.left)
-                return self.right_rotate(node)
-            if balance < -1 and key < right_key:
-                node.right = self.right_rotate(node.right)
-                return self.left_rotate(node)
-
-            return node
-        self.root = insert_helper(self.root, key)
+                node.weight += 1
+                for parent, _ in stack:
+                    parent.weight += 1
+                return
+        new_node = Node[T](key)
+        if not stack:
+            self.root = new_node
+            return
+        parent, went_left = stack[-1]
+        if went_left:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._retrace(stack)
 
     def delete(self, key: Optional[T]) -> None:
         """
         Deletes a key from the tree, triggering rotations.
         If the key has onle one count, then remove it from the tree.
         Otherwise, just decrement its count and update weights along the way.
+        Like insert, the path taken is kept on a stack and retraced afterwards.
 
         Args:
             key (T): key to be deleted.
         """
-        def delete_helper(node: Optional[Node[T]], key: T) -> Optional[Node[T]]:
-            if not node:
-                return None
-            elif key < node.key:
-                node.left = delete_helper(node.left, key)
-            elif key > node.key:
-                node.right = delete_helper(node.right, key)
-            elif node.count > 1:
-                node.count -= 1
+        if key is None:
+            return
+        stack: List[Tuple[Node[T], bool]] = []
+        node = self.root
+        while node:
+            if key < node.key:
+                stack.append((node, True))
+                node = node.left
+            elif node.key < key:
+                stack.append((node, False))
+                node = node.right
             else:
-                if node.left is None:
-                    temp = node.right
-                    node = None
-                    return temp
-                elif node.right is None:
-                    temp = node.left
-                    node = None
-                    return temp
-                temp = self.get_min_value_node(node.right)
-                node.key = temp.key
-                node.count = temp.count
-                node.right = delete_helper(node.right, temp.key)
-            if not node:
-                return node
-            self.set_height(node)
-            self.set_weight(node)
-            balance = self.get_balance(node)
-
-            if balance > 1 and self.get_balance(node.left) >= 0:
-                return self.right_rotate(node)
-            if balance < -1 and self.get_balance(node.right) <= 0:
-                return self.left_rotate(node)
-            if balance > 1 and self.get_balance(node.left) < 0:
-                node.left = self.left_rotate(node.left)
-                return self.right_rotate(node)
-            if balance < -1 and self.get_balance(node.right) > 0:
-                node.right = self.right_rotate(node.right)
-                return self.left_rotate(node)
-            return node
-        if key is not None:
-            self.root = delete_helper(self.root, key)
+                break
+        if not node:
+            return
+        if node.count > 1:
+            node.count -= 1
+            node.weight -= 1
+            for parent, _ in stack:
+                parent.weight -= 1
+            return
+
+        if node.left is None or node.right is None:
+            child = node.left if node.left is not None else node.right
+            if not stack:
+                self.root = child
+                return
+            parent, went_left = stack[-1]
+            if went_left:
+                parent.left = child
+            else:
+                parent.right = child
+        else:
+            stack.append((node, False))
+            successor = node.right
+            while successor.left is not None:
+                stack.append((successor, True))
+                successor = successor.left
+            node.key = successor.key
+            node.count = successor.count
+            parent, went_left = stack[-1]
+            if went_left:
+                parent.left = successor.right
+            else:
+                parent.right = successor.right
+        self._retrace(stack)
+
+    def _retrace(self, stack: List[Tuple[Node[T], bool]]) -> None:
+        """
+        Walks back up a path of nodes, fixing their heights and weights and
+            rotating any node that has become unbalanced.
+        Rotated subtrees are reattached to the parent slot recorded on the stack.
+
+        Args:
+            stack (List[Tuple[Node[T], bool]]): nodes on the path from the root,
+                each paired with whether the path went left from it.
+        """
+        rotations = AVLTree._ROTATIONS
+        get_balance = self.get_balance
+        for i in range(len(stack)-1, -1, -1):
+            node = stack[i][0]
+            left = node.left
+            right = node.right
+            left_height = left.height if left else 0
+            right_height = right.height if right else 0
+            node.height = 1 + (left_height if left_height > right_height else right_height)
+            node.weight = node.count + (left.weight if left else 0) + (right.weight if right else 0)
+            balance = left_height - right_height
+            if -1 <= balance <= 1:
+                continue
+            child_balance = get_balance(left if balance > 0 else right)
+            subtree = rotations[(balance, child_balance)](self, node)
+            if i == 0:
+                self.root = subtree
+            else:
+                parent, went_left = stack[i-1]
+                if went_left:
+                    parent.left = subtree
+                else:
+                    parent.right = subtree
  
     def left_rotate(self, node: Optional[Node[T]]) -> Optional[Node[T]]:
         """
         Rotates the node left.
+        Heights and weights of the two nodes that moved are recomputed inline,
+            since only their children changed.
 
         Args:
             node (Optional[Node[T]]): node to be rotated.
@@ -151,16 +244,23 @@ class AVLTree(Generic[T]):
         right_left = right.left
         right.left = node
         node.right = right_left
- 
-        self.set_height(node)
-        self.set_weight(node)
-        self.set_height(right)
-        self.set_weight(right)
+
+        left = node.left
+        left_height = left.height if left else 0
+        right_left_height = right_left.height if right_left else 0
+        node.height = 1 + (left_height if left_height > right_left_height else right_left_height)
+        node.weight = node.count + (left.weight if left else 0) + (right_left.weight if right_left else 0)
+        right_right = right.right
+        right_right_height = right_right.height if right_right else 0
+        right.height = 1 + (node.height if node.height > right_right_height else right_right_height)
+        right.weight = right.count + node.weight + (right_right.weight if right_right else 0)
         return right
  
     def right_rotate(self, node: Optional[Node[T]]) -> Optional[Node[T]]:
         """
         Rotates the node right.
+        Heights and weights of the two nodes that moved are recomputed inline,
+            since only their children changed.
 
         Args:
             node (Optional[Node[T]]): node to be rotated.
@@ -174,13 +274,42 @@ class AVLTree(Generic[T]):
         left_right = left.right
         left.right = node
         node.left = left_right
- 
-        self.set_height(node)
-        self.set_weight(node)
-        self.set_height(left)
-        self.set_weight(left)
+
+        right = node.right
+        right_height = right.height if right else 0
+        left_right_height = left_right.height if left_right else 0
+        node.height = 1 + (right_height if right_height > left_right_height else left_right_height)
+        node.weight = node.count + (right.weight if right else 0) + (left_right.weight if left_right else 0)
+        left_left = left.left
+        left_left_height = left_left.height if left_left else 0
+        left.height = 1 + (node.height if node.height > left_left_height else left_left_height)
+        left.weight = left.count + node.weight + (left_left.weight if left_left else 0)
         return left
     
+    def _rotate_left_left(self, node: Node[T]) -> Node[T]:
+        return self.right_rotate(node)
+
+    def _rotate_left_right(self, node: Node[T]) -> Node[T]:
+        node.left = self.left_rotate(node.left)
+        return self.right_rotate(node)
+
+    def _rotate_right_right(self, node: Node[T]) -> Node[T]:
+        return self.left_rotate(node)
+
+    def _rotate_right_left(self, node: Node[T]) -> Node[T]:
+        node.right = self.right_rotate(node.right)
+        return self.left_rotate(node)
+
+    # Rotation to apply, keyed by (balance of the node, balance of its taller child).
+    _ROTATIONS = {
+        (2, 1):   _rotate_left_left,
+        (2, 0):   _rotate_left_left,
+        (2, -1):  _rotate_left_right,
+        (-2, -1): _rotate_right_right,
+        (-2, 0):  _rotate_right_right,
+        (-2, 1):  _rotate_right_left,
+    }
+
     def get_key(self, node: Optional[Node[T]]) -> Optional[T]:
         if not node:
             return None
@@ -214,13 +343,12 @@ class AVLTree(Generic[T]):
         Returns:
             T: the minimum value.
         """
-        def get_min_value_helper(node: Optional[Node[T]]) -> Optional[T]:
-            if not node:
-                return None
-            elif not node.left:
-                return node.key
-            return get_min_value_helper(node.left)
-        return get_min_value_helper(self.root)
+        node = self.root
+        if not node:
+            return None
+        while node.left:
+            node = node.left
+        return node.key
     
     def get_min_value_node(self, node: Node[T]) -> Node[T]:
         """
@@ -232,43 +360,64 @@ class AVLTree(Generic[T]):
         Returns:
             Node: node containing the minimum value.
         """
-        if node is None or node.left is None:
+        if node is None:
             return node
-        return self.get_min_value_node(node.left)
+        while node.left is not None:
+            node = node.left
+        return node
+
+    def iter_in_order(self) -> Iterator[T]:
+        """
+        In order traversal of the tree done with an explicit stack.
+        Keys are yielded one at a time, so the caller can stop early.
+
+        Returns:
+            Iterator[T]: the keys in the tree in ascending order.
+        """
+        stack: List[Node[T]] = []
+        node = self.root
+        while node or stack:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
 
     def in_order(self) -> List[T]:
         """
-        In order traversal of the tree done by recursion.
+        In order traversal of the tree.
 
         Returns:
             List[T]: a list of keys in the tree in ascending order.
         """
-        L = []
-        def in_order_helper(node: Optional[Node[T]]) -> None:
-            if not node:
-                return
-            in_order_helper(node.left)
-            L.append(node.key)
-            in_order_helper(node.right)
-        in_order_helper(self.root)
-        return L
+        return list(self.iter_in_order())
     
+    def iter_pre_order(self) -> Iterator[T]:
+        """
+        Pre order traversal of the tree done with an explicit stack.
+        Keys are yielded one at a time, so the caller can stop early.
+
+        Returns:
+            Iterator[T]: the keys in the tree in pre order.
+        """
+        stack: List[Node[T]] = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.key
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
     def pre_order(self) -> List[T]:
         """
-        Pre order traversal of the tree done by recursion.
+        Pre order traversal of the tree.
 
         Returns:
             List[T]: a list of keys in the tree in pre order.
         """
-        L = []
-        def pre_order_helper(node: Optional[Node[T]]) -> None:
-            if not node:
-                return
-            L.append(node.key)
-            pre_order_helper(node.left)
-            pre_order_helper(node.right)
-        pre_order_helper(self.root)
-        return L
+        return list(self.iter_pre_order())
     
     def get_rank(self, key: T) -> int:
         """
@@ -281,13 +430,55 @@ class AVLTree(Generic[T]):
         Returns:
             int: its rank, starting from 1.
         """
-        def rank_helper(node: Optional[Node[T]], key: T) -> int:
-            if not node:
-                return 0
-            elif key < node.key:
-                return rank_helper(node.left, key)
-            elif key > node.key:
-                return self.get_weight(node) - self.get_weight(node.right) + rank_helper(node.right, key)
-            return self.get_weight(node.left)
-        return rank_helper(self.root, key) + 1
+        rank = 1
+        node = self.root
+        while node:
+            node_key = node.key
+            if key < node_key:
+                node = node.left
+            elif node_key < key:
+                rank += node.weight - (node.right.weight if node.right else 0)
+                node = node.right
+            else:
+                return rank + (node.left.weight if node.left else 0)
+        return rank
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Flattens the tree into two contiguous arrays, in ascending order of keys.
+        Keys must be numeric for the arrays to be useful.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: the keys, and the count of each key.
+        """
+        keys: List[T] = []
+        counts: List[int] = []
+        stack: List[Node[T]] = []
+        node = self.root
+        while node or stack:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            keys.append(node.key)
+            counts.append(node.count)
+            node = node.right
+        return np.asarray(keys), np.asarray(counts, dtype=np.int64)
+
+    def get_ranks(self, keys: Iterable[T]) -> np.ndarray:
+        """
+        Gets the ranks of many keys at once.
+        The tree is flattened once by to_arrays, after which every lookup is
+            a binary search done by numpy instead of a walk down the nodes.
+
+        Args:
+            keys (Iterable[T]): numeric keys to be queried.
+
+        Returns:
+            np.ndarray: their ranks, starting from 1.
+        """
+        sorted_keys, counts = self.to_arrays()
+        cumulative = np.concatenate(([0], np.cumsum(counts)))
+        positions = np.searchsorted(sorted_keys, np.asarray(keys), side="left")
+        return cumulative[positions] + 1
     
\ No newline at end of file
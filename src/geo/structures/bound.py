@@ -1,10 +1,13 @@
 from __future__ import annotations
-from typing import Generic, get_args, Tuple, TypeVar
+from typing import Generic, get_args, Tuple, TypeVar, Union, TYPE_CHECKING
 
 import shapely.geometry
 
 from ..geom.pointable import Pointable
 
+if TYPE_CHECKING:
+    from ..geom.shape import Shape
+
 T = TypeVar("T", bound=Pointable)
 
 class Bound(Generic[T]):
@@ -16,17 +19,25 @@ class Bound(Generic[T]):
         max_x (float): right bound of the rectangular box.
         min_y (float): top bound of the rectangular box.
         max_y (float): bottom bound of the rectangular box.
+        _v (Tuple[float, float, float, float]): the sides as (min_x, min_y, max_x, max_y),
+            in the same order as shapely's bounds, so that a side can be picked out by index.
     """
+    __slots__ = ("min_x", "max_x", "min_y", "max_y", "_v")
+
     min_x: float
     max_x: float
     min_y: float
     max_y: float
+    _v:    Tuple[float, float, float, float]
+
+    MIN_X, MIN_Y, MAX_X, MAX_Y = 0, 1, 2, 3
 
     def __init__(self, min_x: float, max_x: float, min_y: float, max_y: float):
         self.min_x = min_x
         self.max_x = max_x
         self.min_y = min_y
         self.max_y = max_y
+        self._v = (min_x, min_y, max_x, max_y)
 
     def __str__(self) -> str:
         return f"x({self.min_x}, {self.max_x}), y({self.min_y}, {self.max_y})"
@@ -42,6 +53,21 @@ class Bound(Generic[T]):
         self.max_x = max(self.max_x, bound.max_x)
         self.min_y = min(self.min_y, bound.min_y)
         self.max_y = max(self.max_y, bound.max_y)
+        self._v = (self.min_x, self.min_y, self.max_x, self.max_y)
+
+    def extend_to(self, x: float, y: float) -> None:
+        """
+        Expands the bound, if needed, such that it contains the point (x, y).
+
+        Args:
+            x (float): x-coordinate to be contained.
+            y (float): y-coordinate to be contained.
+        """
+        self.min_x = min(self.min_x, x)
+        self.max_x = max(self.max_x, x)
+        self.min_y = min(self.min_y, y)
+        self.max_y = max(self.max_y, y)
+        self._v = (self.min_x, self.min_y, self.max_x, self.max_y)
         
     @property
     def center(self) -> Tuple[float, float]:
@@ -57,25 +83,23 @@ class Bound(Generic[T]):
         Returns:
             bool: whether the point lies within the bound.
         """
-        return (point.x >= self.min_x
-                and point.x <= self.max_x
-                and point.y >= self.min_y
-                and point.y <= self.max_y)
+        x, y = point.x, point.y
+        return self.min_x <= x <= self.max_x and self.min_y <= y <= self.max_y
 
     @staticmethod
-    def get_bound_from_shape(shape: shapely.geometry.polygon.Polygon) -> Bound:
+    def get_bound_from_shape(shape: Union[shapely.geometry.polygon.Polygon, Shape]) -> Bound:
         """
-        Converts a shape into a Bound.
+        Converts a shape into a new Bound, which the caller is free to modify.
+        A geo Shape works its bound out from its own coordinates, so that its polygon is not built just for this.
 
         Args:
-            shape (geometry.polygon.Polygon): shape to be converted into bound.
+            shape (Union[geometry.polygon.Polygon, Shape]): shape to be converted into bound.
 
         Returns:
             Bound: the bounds of the shape.
         """
-        return Bound[T](shape.bounds[0],
-                        shape.bounds[2],
-                        shape.bounds[1],
-                        shape.bounds[3])
-
-    
\ No newline at end of file
+        from ..geom.shape import Shape
+        if isinstance(shape, Shape):
+            return shape.get_bounds()
+        min_x, min_y, max_x, max_y = shape.bounds
+        return Bound[T](min_x, max_x, min_y, max_y)
@@ -1,15 +1,188 @@
 from __future__ import annotations
-from functools import cached_property
-from typing import Any, Generic, List, Optional, Tuple, TypeVar
+from array import array
+import math
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar, Union
 
+import numpy as np
 from shapely import geometry
 
 from ..geom.geo_pt import GeoPt
+from ..geom.shape import Shape
 from ..structures.bound import Bound
-from ..structures.quick_sort import median_with_left_right
+
+try:
+    from shapely import contains_xy as _contains_xy
+except ImportError:
+    try:
+        from shapely.vectorized import contains as _contains_xy
+    except (ImportError, ValueError):
+        _contains_xy = None
 
 T = TypeVar("T")
 
+def _contains_points(shape: geometry.base.BaseGeometry, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Tests many points against one shape.
+    Uses shapely.contains_xy, or shapely.vectorized.contains on shapely 1.8, and falls back to
+        one contains call per point when neither can be imported.
+
+    Args:
+        shape (geometry.base.BaseGeometry): shape to be tested against.
+        xs (np.ndarray): x-coordinates of the points.
+        ys (np.ndarray): y-coordinates of the points.
+
+    Returns:
+        np.ndarray: whether each point lies inside the shape.
+    """
+    if _contains_xy is not None:
+        return np.asarray(_contains_xy(shape, xs, ys), dtype=bool)
+    return np.fromiter((shape.contains(geometry.Point(x, y)) for x, y in zip(xs.tolist(), ys.tolist())),
+                       dtype=bool, count=len(xs))
+
+def _prefilter(x: float, y: float, lefts: List[int], rights: List[int], big_bounds: array, bounds: array) -> Iterator[int]:
+    """
+    Walks the flattened tree depth first, pruning subtrees whose big bound does not contain (x, y).
+    Of two children, the one whose big bound has its center nearer to the point is visited first,
+        as it is the more likely of the two to hold the shape, letting the caller stop sooner.
+    A leaf's big bound is its own bound, so leaves that pass the first check are yielded without a second.
+    Only plain numbers are touched here, leaving the shapely checks to the caller.
+
+    Args:
+        x (float): x-coordinate of the point.
+        y (float): y-coordinate of the point.
+        lefts (List[int]): index of each node's left child, -1 if there is none.
+        rights (List[int]): index of each node's right child, -1 if there is none.
+        big_bounds (array): min_x, max_x, min_y, max_y of each node's big bound, packed together.
+        bounds (array): min_x, max_x, min_y, max_y of each node's own bound, packed together.
+
+    Returns:
+        Iterator[int]: indices of the nodes whose own bound contains the point.
+    """
+    stack: List[int] = [0] if lefts else []
+    while stack:
+        i = stack.pop()
+        j = 4*i
+        if not (big_bounds[j] <= x <= big_bounds[j+1] and big_bounds[j+2] <= y <= big_bounds[j+3]):
+            continue
+        left, right = lefts[i], rights[i]
+        if left == -1 and right == -1:
+            yield i
+            continue
+        if bounds[j] <= x <= bounds[j+1] and bounds[j+2] <= y <= bounds[j+3]:
+            yield i
+        if left != -1 and right != -1:
+            l, r = 4*left, 4*right
+            left_dx = x + x - big_bounds[l] - big_bounds[l+1]
+            left_dy = y + y - big_bounds[l+2] - big_bounds[l+3]
+            right_dx = x + x - big_bounds[r] - big_bounds[r+1]
+            right_dy = y + y - big_bounds[r+2] - big_bounds[r+3]
+            if left_dx*left_dx + left_dy*left_dy <= right_dx*right_dx + right_dy*right_dy:
+                stack.append(right)
+                stack.append(left)
+            else:
+                stack.append(left)
+                stack.append(right)
+        elif left != -1:
+            stack.append(left)
+        elif right != -1:
+            stack.append(right)
+
+def _prefilter_batch(xs: np.ndarray, ys: np.ndarray, lefts: np.ndarray, rights: np.ndarray,
+                     big_bounds: np.ndarray, bounds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Walks the flattened tree for many points at once, one level per step.
+    Every (point, node) pair still alive at a level is checked against the big bounds together,
+        and the surviving pairs are expanded to the children of their nodes for the next step.
+
+    Args:
+        xs (np.ndarray): x-coordinates of the points.
+        ys (np.ndarray): y-coordinates of the points.
+        lefts (np.ndarray): index of each node's left child, -1 if there is none.
+        rights (np.ndarray): index of each node's right child, -1 if there is none.
+        big_bounds (np.ndarray): min_x, max_x, min_y, max_y of each node's big bound, one row per node.
+        bounds (np.ndarray): min_x, max_x, min_y, max_y of each node's own bound, one row per node.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: point and node indices of every pair where the node's own bound
+            contains the point.
+    """
+    found_points: List[np.ndarray] = []
+    found_nodes: List[np.ndarray] = []
+    points = np.arange(len(xs)) if len(lefts) else np.empty(0, dtype=np.intp)
+    nodes = np.zeros(len(points), dtype=np.intp)
+    while len(points):
+        x, y = xs[points], ys[points]
+        big_bound = big_bounds[nodes]
+        alive = (big_bound[:, 0] <= x) & (x <= big_bound[:, 1]) & (big_bound[:, 2] <= y) & (y <= big_bound[:, 3])
+        points, nodes, x, y = points[alive], nodes[alive], x[alive], y[alive]
+        bound = bounds[nodes]
+        hit = (bound[:, 0] <= x) & (x <= bound[:, 1]) & (bound[:, 2] <= y) & (y <= bound[:, 3])
+        found_points.append(points[hit])
+        found_nodes.append(nodes[hit])
+        left, right = lefts[nodes], rights[nodes]
+        has_left, has_right = left != -1, right != -1
+        points = np.concatenate((points[has_left], points[has_right]))
+        nodes = np.concatenate((left[has_left], right[has_right]))
+    if not found_points:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    return np.concatenate(found_points), np.concatenate(found_nodes)
+
+def _median_order(coords: np.ndarray) -> List[int]:
+    """
+    Orders shapes so that each is preceded by the medians it would sit under in a balanced tree,
+        cycling through the sides of their bounds in the same order as the tree does.
+
+    Args:
+        coords (np.ndarray): (N, 4) array of bounds as (min_x, min_y, max_x, max_y).
+
+    Returns:
+        List[int]: indices into coords, medians first.
+    """
+    order: List[int] = []
+    stack: List[Tuple[np.ndarray, int]] = [(np.arange(len(coords)), Bound.MIN_X)]
+    while stack:
+        indices, axis = stack.pop()
+        if len(indices) == 0:
+            continue
+        k = len(indices) // 2
+        if len(indices) > 1:
+            indices = indices[np.argpartition(coords[indices, axis], k)]
+        order.append(int(indices[k]))
+        next_axis = BoundsNode._NEXT[axis]
+        stack.append((indices[k+1:], next_axis))
+        stack.append((indices[:k], next_axis))
+    return order
+
+def _is_rect(shape: Union[geometry.polygon.Polygon, Shape], bound: Bound) -> bool:
+    """
+    Checks whether a shape is a plain axis-aligned rectangle, and so is exactly its own bound.
+    A geo Shape is checked through its polygon.
+
+    Args:
+        shape (Union[geometry.polygon.Polygon, Shape]): shape to be checked.
+        bound (Bound): bound of the shape.
+
+    Returns:
+        bool: whether the shape is an axis-aligned rectangle with no holes.
+    """
+    if isinstance(shape, Shape):
+        shape = shape.polygon
+    if getattr(shape, "geom_type", None) != "Polygon" or len(shape.interiors) > 0:
+        return False
+    if not (bound.min_x < bound.max_x and bound.min_y < bound.max_y):
+        return False
+    if len(shape.exterior.coords) != 5:
+        return False
+    coords = list(shape.exterior.coords)
+    if len(set(coords[:4])) != 4:
+        return False
+    for (x0, y0), (x1, y1) in zip(coords, coords[1:]):
+        if x0 != x1 and y0 != y1:
+            return False
+        if x0 not in (bound.min_x, bound.max_x) or y0 not in (bound.min_y, bound.max_y):
+            return False
+    return True
+
 class BoundsNode(Generic[T]):
     """
     Encapsulates a node of the BoundsTree.
@@ -19,68 +192,90 @@ class BoundsNode(Generic[T]):
         value (T): any special value we want to associate with this shape.
         bound (Bound): the Bounds of this node's shape.
         big_bound (Bound): the Bounds that contains the shapes of this node as well as its descendants.
-        level (str): whether we are comparing min_x, max_x, min_y, max_y.
+        axis (int): which side of the bounds we are comparing, as an index into Bound._v
+            (Bound.MIN_X, Bound.MIN_Y, Bound.MAX_X or Bound.MAX_Y).
         left (Optional[BoundsNode[T]]): the left child of the node.
         right (Optional[BoundsNode[T]]): the right child of the node.
+        _is_rect (bool): whether the shape is an axis-aligned rectangle, so containment can be read off its bound.
     """
+    __slots__ = ("shape", "value", "bound", "big_bound", "axis", "left", "right", "_is_rect")
+
     shape:     geometry.polygon.Polygon
     value:     T
     bound:     Bound[GeoPt]
     big_bound: Bound[GeoPt]
-    level:     str
+    axis:      int
     left:      Optional[BoundsNode[T]]
     right:     Optional[BoundsNode[T]]
+    _is_rect:  bool
+
+    _NEXT = (Bound.MIN_Y, Bound.MAX_X, Bound.MAX_Y, Bound.MIN_X)
 
-    def __init__(self, shape: geometry.polygon.Polygon, value: T, level: str):
+    def __init__(self, shape: geometry.polygon.Polygon, value: T, axis: int, bound: Optional[Bound[GeoPt]]=None):
         """
         Initialiser for the BoundsNode[T] object.
         Left and right children are set to None as the node would be initialised as a leaf node.
+        The bound of the shape can be passed in if it has already been computed.
         """
         self.shape = shape
         self.value = value
-        self.bound = Bound[GeoPt].get_bound_from_shape(shape)
-        self.big_bound = self.bound
-        self.level = level
+        self.bound = bound if bound is not None else Bound[GeoPt].get_bound_from_shape(shape)
+        self.big_bound = Bound[GeoPt](self.bound.min_x, self.bound.max_x, self.bound.min_y, self.bound.max_y)
+        self.axis = axis
         self.left = None
         self.right = None
+        self._is_rect = _is_rect(shape, self.bound)
 
-    @cached_property
-    def next_level(self) -> str:
-        """
-        Based on the current level of the node, compute the next level.
-        The cycle goes: min_x -> min_y -> max_x -> max_y.
-
-        Returns:
-            str: 'min_x' or 'min_y' or 'max_x' or 'max_y'
-        """
-        level_mapping = {"min_x": "min_y",
-                         "min_y": "max_x",
-                         "max_x": "max_y",
-                         "max_y": "min_x",}
-        return level_mapping[self.level]
-
-    def add(self, shape: geometry.polygon.Polygon, value: T=None) -> None:
+    def add(self, shape: geometry.polygon.Polygon, value: T=None, bound: Optional[Bound[GeoPt]]=None) -> List[BoundsNode[T]]:
         """
         Adds a shape-value pair to the Node.
-        It will create a new leaf if there is a vacancy in the right location.
-        Otherwise, the arguments will be passed on to its children.
+        Walks down from this node, widening the big bound of every node passed,
+            until a vacancy is found in the right location for a new leaf.
 
         Args:
             shape (geometry.polygon.Polygon): shape to be added.
             value (T, optional): value associated with the shape. Defaults to None.
+            bound (Optional[Bound[GeoPt]], optional): bound of the shape, if already computed. Defaults to None.
+
+        Returns:
+            List[BoundsNode[T]]: the nodes passed on the way down, starting from this node and ending with the new leaf.
         """
-        bound: Bound = Bound.get_bound_from_shape(shape)
-        self.big_bound.merge_with(bound)
-        if getattr(bound, self.level) <= getattr(self.bound, self.level):
-            if self.left == None:
-                self.left = BoundsNode[T](shape, value, self.next_level)
+        if bound is None:
+            bound = Bound.get_bound_from_shape(shape)
+        v = bound._v
+        node = self
+        path: List[BoundsNode[T]] = []
+        while True:
+            path.append(node)
+            node.big_bound.merge_with(bound)
+            axis = node.axis
+            if v[axis] <= node.bound._v[axis]:
+                if node.left is None:
+                    node.left = BoundsNode[T](shape, value, BoundsNode._NEXT[axis], bound)
+                    path.append(node.left)
+                    return path
+                node = node.left
             else:
-                self.left.add(shape, value)
-        else:
-            if self.right == None:
-                self.right = BoundsNode[T](shape, value, self.next_level)
-            else:
-                self.right.add(shape, value)
+                if node.right is None:
+                    node.right = BoundsNode[T](shape, value, BoundsNode._NEXT[axis], bound)
+                    path.append(node.right)
+                    return path
+                node = node.right
+
+    def subtree(self) -> List[BoundsNode[T]]:
+        """
+        Gathers this node and all of its descendants.
+
+        Returns:
+            List[BoundsNode[T]]: the nodes in the subtree, in pre order.
+        """
+        nodes: List[BoundsNode[T]] = []
+        stack: List[BoundsNode[T]] = [self]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(child for child in (node.right, node.left) if child)
+        return nodes
 
 class BoundsTree(Generic[T]):
     """
@@ -89,14 +284,32 @@ class BoundsTree(Generic[T]):
         which polygon contains a certain point.
     At each depth level, we compare alternating coordinates, starting with min_x.
 
+    Queries run on a flattened copy of the tree, built lazily after any change.
+    The nodes are laid out in van Emde Boas order, with children referred to by index
+        and the big bounds packed four floats per node into a single array.
+
     Fields:
         root (Optional[BoundsNode[T]]): the root of the tree.
         weight (int): the number of nodes in the tree.
         big_bound (Bound[U]): the Bound object containing all shapes in the tree.
+        _nodes (Optional[List[BoundsNode[T]]]): the nodes in van Emde Boas order, or None if stale.
+        _lefts (List[int]): index of each node's left child, -1 if there is none.
+        _rights (List[int]): index of each node's right child, -1 if there is none.
+        _big_bounds (array): min_x, max_x, min_y, max_y of each node's big bound, packed together.
+        _packed_bounds (array): min_x, max_x, min_y, max_y of each node's own bound, packed together.
+        _bounds (np.ndarray): view of _packed_bounds with one row per node.
     """
-    root:      Optional[BoundsNode[T]]
-    weight:    int
-    big_bound: Bound[GeoPt]
+    root:        Optional[BoundsNode[T]]
+    weight:      int
+    big_bound:   Bound[GeoPt]
+    _nodes:      Optional[List[BoundsNode[T]]]
+    _lefts:      List[int]
+    _rights:     List[int]
+    _big_bounds:    array
+    _packed_bounds: array
+    _bounds:        np.ndarray
+
+    _BALANCE = 0.75
 
     def __init__(self):
         """
@@ -106,6 +319,12 @@ class BoundsTree(Generic[T]):
         self.root = None
         self.weight = 0
         self.big_bound = Bound[GeoPt](float("inf"), float("-inf"), float("inf"), float("-inf"))
+        self._nodes = None
+        self._lefts = []
+        self._rights = []
+        self._big_bounds = array("d")
+        self._packed_bounds = array("d")
+        self._bounds = np.empty((0, 4), dtype=np.float64)
 
     def __str__(self) -> str:
         return str(self.in_order())
@@ -113,52 +332,188 @@ class BoundsTree(Generic[T]):
     def __repr__(self) -> str:
         return f"<BoundsTree: {self.big_bound}>"
 
+    def add(self, shape: geometry.polygon.Polygon, value: T=None) -> None:
+        """
+        Adds a single shape-value pair to the tree, creating a new root if it does not exist.
+
+        Args:
+            shape (geometry.polygon.Polygon): shape to be added.
+            value (T, optional): value associated with the shape. Defaults to None.
+        """
+        bound = Bound.get_bound_from_shape(shape)
+        if self.root == None:
+            self.root = BoundsNode[T](shape, value, Bound.MIN_X, bound)
+            self.big_bound = Bound[GeoPt](bound.min_x, bound.max_x, bound.min_y, bound.max_y)
+        else:
+            self.root.add(shape, value, bound)
+            self.big_bound.merge_with(bound)
+        self.weight += 1
+        self._nodes = None
+
+    @classmethod
+    def build(cls, shapes: List[geometry.polygon.Polygon], values: List[T]) -> BoundsTree[T]:
+        """
+        Builds a balanced tree out of all the shape-value pairs at once.
+
+        Args:
+            shapes (List[geometry.polygon.Polygon]): list of shapes to be added.
+            values (List[T]): values associated with each shape.
+
+        Returns:
+            BoundsTree[T]: the resulting tree.
+        """
+        tree = cls()
+        tree.add_all(shapes, values)
+        return tree
+
     def add_all(self, shapes: List[geometry.polygon.Polygon], values: List[T]) -> None:
         """
-        Adds all shape-value pairs to the tree, creating a new root if it does not exist.
+        Adds all shape-value pairs to the tree.
+        If the tree is empty, or the batch is at least as large as the tree, the whole tree,
+            including any shapes already in it, is rebuilt balanced from medians.
+        Otherwise the batch is inserted one shape at a time, medians first, so that a sorted batch
+            does not grow a chain. Should an insertion still land deeper than log base 1/_BALANCE of the
+            weight, the lowest ancestor whose child holds more than _BALANCE of its subtree is rebuilt,
+            as in a scapegoat tree, instead of the whole tree.
 
         Args:
             shapes (List[geometry.polygon.Polygon]): list of shapes to be added.
             values (List[T]): values associated with each shape.
         """
-        zipped = list(zip(shapes, values))
-        sorted_zip: List[Tuple[geometry.polygon.Polygon, T]] = []
-        
-        def append_median(_list: List[Tuple[geometry.polygon.Polygon, T]], xymm: str) -> None:
-            if len(_list) == 0:
-                return
-            left, mid, right = median_with_left_right(_list,
-                                                      comparator=lambda item: getattr(Bound.get_bound_from_shape(item[0]), xymm))
-            if mid is not None:
-                sorted_zip.append(mid)
-            if xymm == "min_x":
-                append_median(left, "min_y")
-                append_median(right, "min_y")
-            elif xymm == "min_y":
-                append_median(left, "max_x")
-                append_median(right, "max_x")
-            elif xymm == "max_x":
-                append_median(left, "max_y")
-                append_median(right, "max_y")
-            else:
-                append_median(left, "max_x")
-                append_median(right, "max_x")
-        append_median(zipped, "min_x")
-        
-        if self.root == None:
-            self.root = BoundsNode[T](sorted_zip[0][0], sorted_zip[0][1], "min_x")
-            self.big_bound = Bound.get_bound_from_shape(shapes[0])
-            sorted_zip = sorted_zip[1:]
-            self.weight += 1
-            
-        for shape, value in sorted_zip:
-            self.root.add(shape, value)
-            self.big_bound.merge_with(Bound.get_bound_from_shape(shape))
+        count = min(len(shapes), len(values))
+        if count == 0:
+            return
+        if self.root is None or count >= self.weight:
+            nodes = self.root.subtree() if self.root else []
+            nodes.extend(BoundsNode[T](shapes[i], values[i], Bound.MIN_X) for i in range(count))
+            self.root = BoundsTree._build_balanced(nodes, Bound.MIN_X)
+            self.big_bound = Bound[GeoPt](self.root.big_bound.min_x, self.root.big_bound.max_x,
+                                          self.root.big_bound.min_y, self.root.big_bound.max_y)
+            self.weight = len(nodes)
+            self._nodes = None
+            return
+
+        bounds = [Bound.get_bound_from_shape(shapes[i]) for i in range(count)]
+        for i in _median_order(np.array([bound._v for bound in bounds], dtype=np.float64)):
+            path = self.root.add(shapes[i], values[i], bounds[i])
+            self.big_bound.merge_with(bounds[i])
             self.weight += 1
+            if len(path) - 1 > math.log(self.weight) / math.log(1 / BoundsTree._BALANCE):
+                self._rebuild_scapegoat(path)
+        self._nodes = None
+
+    def _rebuild_scapegoat(self, path: List[BoundsNode[T]]) -> None:
+        """
+        Walks back up from a freshly added leaf to the lowest ancestor whose child on the path holds
+            more than _BALANCE of the ancestor's subtree, and rebuilds that subtree balanced from medians.
+        The rebuilt subtree holds the same shapes, so the big bounds of the nodes above it still hold.
+
+        Args:
+            path (List[BoundsNode[T]]): the nodes from the root down to the new leaf.
+        """
+        size = 1
+        for j in range(len(path) - 2, -1, -1):
+            parent, child = path[j], path[j+1]
+            sibling = parent.right if parent.left is child else parent.left
+            parent_size = size + 1 + (len(sibling.subtree()) if sibling else 0)
+            if size > BoundsTree._BALANCE * parent_size:
+                rebuilt = BoundsTree._build_balanced(parent.subtree(), parent.axis)
+                if j == 0:
+                    self.root = rebuilt
+                elif path[j-1].left is parent:
+                    path[j-1].left = rebuilt
+                else:
+                    path[j-1].right = rebuilt
+                return
+            size = parent_size
+
+    @staticmethod
+    def _build_balanced(nodes: List[BoundsNode[T]], axis: int) -> Optional[BoundsNode[T]]:
+        """
+        Rearranges existing nodes into a tree balanced from medians, without recreating them,
+            so no shape or bound is looked at again.
+        The axis, children and big bound of every node are reset along the way.
+
+        Args:
+            nodes (List[BoundsNode[T]]): nodes to be arranged.
+            axis (int): the axis the root of the arrangement compares on.
+
+        Returns:
+            Optional[BoundsNode[T]]: the root of the arrangement, or None if there are no nodes.
+        """
+        coords = np.array([node.bound._v for node in nodes], dtype=np.float64).reshape(-1, 4)
+
+        def build_median(indices: np.ndarray, axis: int) -> Optional[BoundsNode[T]]:
+            if len(indices) == 0:
+                return None
+            k = len(indices) // 2
+            if len(indices) > 1:
+                indices = indices[np.argpartition(coords[indices, axis], k)]
+            node = nodes[int(indices[k])]
+            bound = node.bound
+            node.axis = axis
+            node.big_bound = Bound[GeoPt](bound.min_x, bound.max_x, bound.min_y, bound.max_y)
+            next_axis = BoundsNode._NEXT[axis]
+            node.left = build_median(indices[:k], next_axis)
+            node.right = build_median(indices[k+1:], next_axis)
+            if node.left:
+                node.big_bound.merge_with(node.left.big_bound)
+            if node.right:
+                node.big_bound.merge_with(node.right.big_bound)
+            return node
+        return build_median(np.arange(len(nodes)), axis)
+
+    def _flatten(self) -> List[BoundsNode[T]]:
+        """
+        Lays the tree out in van Emde Boas order, if it has changed since the last layout.
+        The top half of the levels is laid out first, followed by each of the subtrees hanging off it,
+            each laid out the same way, so that a path from the root stays in a few nearby blocks.
+
+        Returns:
+            List[BoundsNode[T]]: the nodes in van Emde Boas order.
+        """
+        if self._nodes is not None:
+            return self._nodes
+
+        height = 0
+        level = [self.root] if self.root else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child]
+
+        nodes: List[BoundsNode[T]] = []
+        def veb_helper(node: BoundsNode[T], levels: int) -> None:
+            if levels == 1:
+                nodes.append(node)
+                return
+            top_levels = levels // 2
+            veb_helper(node, top_levels)
+            frontier = [node]
+            for _ in range(top_levels):
+                frontier = [child for parent in frontier for child in (parent.left, parent.right) if child]
+            for subtree in frontier:
+                veb_helper(subtree, levels - top_levels)
+        if self.root:
+            veb_helper(self.root, height)
+
+        index: Dict[int, int] = {id(node): i for i, node in enumerate(nodes)}
+        self._lefts = [index[id(node.left)] if node.left else -1 for node in nodes]
+        self._rights = [index[id(node.right)] if node.right else -1 for node in nodes]
+        self._big_bounds = array("d")
+        self._packed_bounds = array("d")
+        for node in nodes:
+            big_bound, bound = node.big_bound, node.bound
+            self._big_bounds.extend((big_bound.min_x, big_bound.max_x, big_bound.min_y, big_bound.max_y))
+            self._packed_bounds.extend((bound.min_x, bound.max_x, bound.min_y, bound.max_y))
+        self._bounds = np.frombuffer(self._packed_bounds, dtype=np.float64).reshape(-1, 4)
+        self._nodes = nodes
+        return nodes
 
     def find_bounds_containing(self, point: GeoPt) -> List[Bound]:
         """
-        Recursively finds all the bounds objects that contain the point.
+        Finds all the bounds objects that contain the point.
+        Walks the flattened tree in pre order with an explicit stack,
+            reading each big bound straight out of the packed array.
 
         Args:
             point (T): point to be queried.
@@ -166,19 +521,30 @@ class BoundsTree(Generic[T]):
         Returns:
             List[Bound]: Bound objects that contain the point.
         """
+        nodes = self._flatten()
+        x, y = point.x, point.y
+        lefts, rights, big_bounds = self._lefts, self._rights, self._big_bounds
         L: List[Bound] = []
-        def find_bounds_containing_helper(node: Optional[BoundsNode[T]]) -> None:
-            if not node or not node.big_bound.contains(point):
-                return
-            L.append(node.bound)
-            find_bounds_containing_helper(node.left)
-            find_bounds_containing_helper(node.right)
-        find_bounds_containing_helper(self.root)
+        stack: List[int] = [0] if nodes else []
+        while stack:
+            i = stack.pop()
+            j = 4*i
+            if not (big_bounds[j] <= x <= big_bounds[j+1] and big_bounds[j+2] <= y <= big_bounds[j+3]):
+                continue
+            L.append(nodes[i].bound)
+            if rights[i] != -1:
+                stack.append(rights[i])
+            if lefts[i] != -1:
+                stack.append(lefts[i])
         return L
 
     def find_shape(self, point: GeoPt) -> Optional[T]:
         """
         Finds the singular shape in the tree that contains the point and returns its value.
+        Candidates come from the numeric prefilter, so shapely is only asked about shapes
+            whose own bound already contains the point.
+        Rectangles are settled against the packed bounds, using the point's coordinates read once at the start.
+        Like shapely, points on the boundary of a rectangle are not contained.
 
         Args:
             point (T): point to be queried.
@@ -186,50 +552,138 @@ class BoundsTree(Generic[T]):
         Returns:
             T: value associated with the shape queried.
         """
-        value: List[Optional[T]] = [None]
-        def find_shape_helper(node: Optional[BoundsNode[T]]) -> None:
-            if not node or not node.big_bound.contains(point):
-                return
-            if not node.shape.contains(point):
-                find_shape_helper(node.left)
-                find_shape_helper(node.right)
-                return
-            value[0] = node.value
-        find_shape_helper(self.root)
-        return value[0]
+        nodes = self._flatten()
+        x, y = point.x, point.y
+        bounds = self._packed_bounds
+        for i in _prefilter(x, y, self._lefts, self._rights, self._big_bounds, bounds):
+            node = nodes[i]
+            if node._is_rect:
+                j = 4*i
+                if bounds[j] < x < bounds[j+1] and bounds[j+2] < y < bounds[j+3]:
+                    return node.value
+            elif node.shape.contains(point):
+                return node.value
+        return None
 
 
+    def find_shapes(self, xs: np.ndarray, ys: np.ndarray) -> List[Optional[T]]:
+        """
+        Finds the shape containing each of many points, returning their values.
+        All the points descend the tree together, so the pruning runs as numpy operations
+            over whole levels instead of once per point per node.
+        Each candidate shape is then tested against all of its points in one vectorised shapely call.
+        A point inside more than one shape gets the value find_shape would return, by walking
+            the tree for that point alone in the same order and keeping the first shape it meets.
+
+        Args:
+            xs (np.ndarray): x-coordinates of the points to be queried.
+            ys (np.ndarray): y-coordinates of the points to be queried.
+
+        Returns:
+            List[Optional[T]]: value associated with the shape containing each point, or None.
+        """
+        nodes = self._flatten()
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        ys = np.asarray(ys, dtype=np.float64).ravel()
+        candidate_points, candidate_nodes = _prefilter_batch(xs, ys,
+                                                             np.asarray(self._lefts, dtype=np.intp),
+                                                             np.asarray(self._rights, dtype=np.intp),
+                                                             np.frombuffer(self._big_bounds, dtype=np.float64).reshape(-1, 4),
+                                                             self._bounds)
+        order = np.argsort(candidate_nodes, kind="stable")
+        candidate_points, candidate_nodes = candidate_points[order], candidate_nodes[order]
+        starts = np.flatnonzero(np.diff(candidate_nodes, prepend=-1))
+        ends = np.append(starts[1:], len(candidate_nodes))
+
+        hits: Dict[int, List[int]] = {}
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            points = candidate_points[start:end]
+            i = int(candidate_nodes[start])
+            node = nodes[i]
+            x, y = xs[points], ys[points]
+            if node._is_rect:
+                bound = node.bound
+                inside = (bound.min_x < x) & (x < bound.max_x) & (bound.min_y < y) & (y < bound.max_y)
+            else:
+                shape = node.shape
+                inside = _contains_points(shape.polygon if isinstance(shape, Shape) else shape, x, y)
+            for p in points[inside].tolist():
+                hits.setdefault(p, []).append(i)
+
+        values: List[Optional[T]] = [None] * len(xs)
+        for p, found in hits.items():
+            if len(found) == 1:
+                values[p] = nodes[found[0]].value
+                continue
+            found_set = set(found)
+            for i in _prefilter(float(xs[p]), float(ys[p]), self._lefts, self._rights, self._big_bounds, self._packed_bounds):
+                if i in found_set:
+                    values[p] = nodes[i].value
+                    break
+        return values
+
+    def find_shapes_batch(self, points: np.ndarray) -> List[Optional[T]]:
+        """
+        Finds the shape containing each of many points, returning their values.
+
+        Args:
+            points (np.ndarray): (N, 2) array of x-y coordinates to be queried.
+
+        Returns:
+            List[Optional[T]]: value associated with the shape containing each point, or None.
+        """
+        xy = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return self.find_shapes(xy[:, 0], xy[:, 1])
+
+    def iter_in_order(self) -> Iterator[Bound]:
+        """
+        In order traversal of the tree done with an explicit stack.
+        Bounds are yielded one at a time, so the caller can stop early.
+
+        Returns:
+            Iterator[Bound]: the bounds in the tree.
+        """
+        stack: List[BoundsNode[T]] = []
+        node = self.root
+        while node or stack:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.bound
+            node = node.right
+
     def in_order(self) -> List[Bound]:
         """
-        In order traversal of the tree done by recursion.
+        In order traversal of the tree.
 
         Returns:
             List[Bound]: a list of bounds in the tree.
         """
-        L: List[Bound] = []
-        def in_order_helper(node: Optional[BoundsNode[T]]) -> None:
-            if not node:
-                return
-            in_order_helper(node.left)
-            L.append(node.bound)
-            in_order_helper(node.right)
-        in_order_helper(self.root)
-        return L
+        return list(self.iter_in_order())
+
+    def iter_pre_order(self) -> Iterator[Bound]:
+        """
+        Pre order traversal of the tree done with an explicit stack.
+        Bounds are yielded one at a time, so the caller can stop early.
+
+        Returns:
+            Iterator[Bound]: the bounds in the tree.
+        """
+        stack: List[BoundsNode[T]] = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.bound
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
 
     def pre_order(self) -> List[Bound]:
         """
-        Pre order traversal of the tree done by recursion.
+        Pre order traversal of the tree.
 
         Returns:
             List[Bound]: a list of bounds in the tree.
         """
-        L: List[Bound] = []
-        def pre_order_helper(node: Optional[BoundsNode[T]]) -> None:
-            if not node:
-                return
-            L.append(node.bound)
-            pre_order_helper(node.left)
-            pre_order_helper(node.right)
-        pre_order_helper(self.root)
-        return L
-    
\ No newline at end of file
+        return list(self.iter_pre_order())
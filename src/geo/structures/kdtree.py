@@ -1,15 +1,182 @@
 from __future__ import annotations
-from functools import cached_property
-from typing import List, Generic, Optional, Tuple, TypeVar
+from array import array
+from typing import Iterator, List, Generic, Optional, Tuple, TypeVar, Union
+
+import numpy as np
 
 from .bound import Bound
-from .quick_sort import median_with_left_right
 from ..geom.pointable import Pointable
 
 T = TypeVar("T", bound=Pointable)
 
 class XY:
-    X, Y = "x", "y"
+    X, Y = 0, 1
+
+def _flat_layout(xs: np.ndarray, ys: np.ndarray) -> Tuple[List[int], List[int], List[int], List[int]]:
+    """
+    Lays a balanced tree over the coordinates out in pre order, without creating any nodes.
+    Each median is picked out with np.argpartition on the splitting axis, alternating between x and y.
+
+    Args:
+        xs (np.ndarray): x-coordinate of each point.
+        ys (np.ndarray): y-coordinate of each point.
+
+    Returns:
+        Tuple[List[int], List[int], List[int], List[int]]: for each node in pre order, the index of its point,
+            the axis it splits on, and the index of its left and right child (-1 if there is none).
+    """
+    coords = (xs, ys)
+    order: List[int] = []
+    axes: List[int] = []
+    lefts: List[int] = []
+    rights: List[int] = []
+    stack: List[Tuple[np.ndarray, int, int, bool]] = [(np.arange(len(xs)), XY.X, -1, False)] if len(xs) else []
+    while stack:
+        indices, axis, parent, is_right = stack.pop()
+        k = len(indices) // 2
+        if len(indices) > 1:
+            indices = indices[np.argpartition(coords[axis][indices], k)]
+        i = len(order)
+        order.append(int(indices[k]))
+        axes.append(axis)
+        lefts.append(-1)
+        rights.append(-1)
+        if parent != -1:
+            (rights if is_right else lefts)[parent] = i
+        if k+1 < len(indices):
+            stack.append((indices[k+1:], axis ^ 1, i, True))
+        if k > 0:
+            stack.append((indices[:k], axis ^ 1, i, False))
+    return order, axes, lefts, rights
+
+def _nearest_flat(qx: float, qy: float, xs: array, ys: array,
+                  axes: List[int], lefts: List[int], rights: List[int]) -> Tuple[int, float]:
+    """
+    Searches a flattened, non-empty tree for the point nearest to (qx, qy).
+    Uses an explicit stack of nodes, each paired with the squared distance to the splitting line
+        that separates it from the target, searching the nearer child first.
+    The search stops as soon as a node sits exactly on the target, since nothing can be nearer.
+    Only plain numbers are touched here, leaving the points themselves to the caller.
+
+    Args:
+        qx (float): x-coordinate of the target.
+        qy (float): y-coordinate of the target.
+        xs (array): x-coordinate of each node.
+        ys (array): y-coordinate of each node.
+        axes (List[int]): axis each node splits on, 0 for x and 1 for y.
+        lefts (List[int]): index of each node's left child, -1 if there is none.
+        rights (List[int]): index of each node's right child, -1 if there is none.
+
+    Returns:
+        Tuple[int, float]: index of the nearest node, and its squared x-y distance to the target.
+    """
+    best = 0
+    best_d2 = float("inf")
+    stack: List[Tuple[int, float]] = [(0, 0.0)]
+    while stack:
+        i, plane_d2 = stack.pop()
+        if plane_d2 >= best_d2:
+            continue
+        dx = qx - xs[i]
+        dy = qy - ys[i]
+        d2 = dx*dx + dy*dy
+        if d2 < best_d2:
+            best, best_d2 = i, d2
+            if d2 == 0.0:
+                break
+        diff = dx if axes[i] == 0 else dy
+        if diff < 0:
+            near, far = lefts[i], rights[i]
+        else:
+            near, far = rights[i], lefts[i]
+        if far != -1:
+            stack.append((far, diff*diff))
+        if near != -1:
+            stack.append((near, plane_d2))
+    return best, best_d2
+
+def _nearest_brute(qx: Union[float, np.ndarray], qy: Union[float, np.ndarray], xs: array, ys: array) -> Union[int, np.ndarray]:
+    """
+    Finds the point nearest to each target by working out the squared distance to every node at once.
+    For small trees this beats walking the tree, as numpy does the work without a Python loop.
+
+    Args:
+        qx (Union[float, np.ndarray]): x-coordinate of the target, or of each target.
+        qy (Union[float, np.ndarray]): y-coordinate of the target, or of each target.
+        xs (array): x-coordinate of each node.
+        ys (array): y-coordinate of each node.
+
+    Returns:
+        Union[int, np.ndarray]: index of the nearest node, or of the nearest node to each target.
+    """
+    dx = np.asarray(qx, dtype=np.float64)[..., None] - np.frombuffer(xs, dtype=np.float64)
+    dy = np.asarray(qy, dtype=np.float64)[..., None] - np.frombuffer(ys, dtype=np.float64)
+    return np.argmin(dx*dx + dy*dy, axis=-1)
+
+class FlatKDTree:
+    """
+    Encapsulates a KDTree laid out over arrays of coordinates, for when there are no point objects to hold.
+    The layout is built once and searched with the same squared x-y distance as KDTree,
+        and sets of coordinates no larger than KDTree's brute-force threshold are scanned directly instead.
+
+    Fields:
+        order (List[int]): for each node in pre order, the index of its coordinates in the original arrays.
+        xs (array): x-coordinate of each node.
+        ys (array): y-coordinate of each node.
+        axes (List[int]): axis each node splits on, 0 for x and 1 for y.
+        lefts (List[int]): index of each node's left child, -1 if there is none.
+        rights (List[int]): index of each node's right child, -1 if there is none.
+    """
+    __slots__ = ("order", "xs", "ys", "axes", "lefts", "rights")
+
+    order:  List[int]
+    xs:     array
+    ys:     array
+    axes:   List[int]
+    lefts:  List[int]
+    rights: List[int]
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray):
+        """
+        Initialiser for the FlatKDTree object.
+
+        Args:
+            xs (np.ndarray): x-coordinate of each point.
+            ys (np.ndarray): y-coordinate of each point.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if len(xs) <= KDTree._BRUTE_FORCE_THRESHOLD:
+            self.order, self.axes, self.lefts, self.rights = list(range(len(xs))), [], [], []
+        else:
+            self.order, self.axes, self.lefts, self.rights = _flat_layout(xs, ys)
+        self.xs = array("d", xs[self.order].tolist())
+        self.ys = array("d", ys[self.order].tolist())
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def nearest(self, x: float, y: float) -> Tuple[int, float]:
+        """
+        Finds the coordinates nearest to the target.
+        If there are none, return (-1, float('inf')).
+
+        Args:
+            x (float): x-coordinate of the target.
+            y (float): y-coordinate of the target.
+
+        Returns:
+            Tuple[int, float]: index of the nearest coordinates in the original arrays,
+                and their squared x-y distance to the target.
+        """
+        if not self.order:
+            return (-1, float("inf"))
+        if not self.axes:
+            best = int(_nearest_brute(x, y, self.xs, self.ys))
+            dx, dy = x - self.xs[best], y - self.ys[best]
+            return (self.order[best], dx*dx + dy*dy)
+        best, d2 = _nearest_flat(x, y, self.xs, self.ys, self.axes, self.lefts, self.rights)
+        return (self.order[best], d2)
 
 class KDNode(Generic[T]):
     """
@@ -17,17 +184,21 @@ class KDNode(Generic[T]):
 
     Fields:
         point (T): the point it is representing in the tree.
-        level (str): whether the we compare x or y-values at this point.
+        axis (int): whether the we compare x or y-values at this point, XY.X or XY.Y.
             (We alternate between x and y).
+        xy (Tuple[float, float]): the x-y coordinates of the point, so that a side can be picked out by index.
         left (Optional[KDNode[T]]): the left child of this node.
         right (Optional[KDNode[T]]): the right child of this node.
     """
+    __slots__ = ("point", "axis", "xy", "left", "right")
+
     point: T
-    level: str
+    axis:  int
+    xy:    Tuple[float, float]
     left:  Optional[KDNode[T]]
     right: Optional[KDNode[T]]
 
-    def __init__(self, point: T, level: str):
+    def __init__(self, point: T, axis: int):
         """
         Initialiser for the KDNode[T] object.
         The left and right children are both set to zero
@@ -35,51 +206,46 @@ class KDNode(Generic[T]):
 
         Args:
             point (T): point to be represented by the node.
-            level (str): 'x' or 'y'.
+            axis (int): XY.X or XY.Y.
         """
         self.point = point
-        self.level = level
+        self.axis = axis
+        self.xy = (point.x, point.y)
         self.left = None
         self.right = None
         
-    @cached_property
-    def next_level(self) -> str:
-        """
-        Computes the next level of this node.
-        So, 'x' will be mapped to 'y' and vice versa.
-        This helps to eliminate the need for if statements when traversing the tree.
-
-        Returns:
-            str: 'x' or 'y' value.
-        """
-        if self.level == XY.X:
-            return XY.Y
-        else:
-            return XY.X
-        
     def add(self, point: T) -> None:
         """
         Adds the point to the node.
-        If there is a vacancy, the point will join the tree as a new node.
-        Otherwise, the point will be passed on to the relevant child's add method.
+        The point's coordinates are read once, and then the tree is walked down
+            until there is a vacancy for the point to join the tree as a new node.
 
         Args:
             point (T): the point to be added to the node.
         """
-        if getattr(point, self.level) <= getattr(self.point, self.level):
-            if self.left == None:
-                self.left = KDNode[T](point, self.next_level)
-            else:
-                self.left.add(point)
-        else:
-            if self.right == None:
-                self.right = KDNode[T](point, self.next_level)
+        xy = (point.x, point.y)
+        node = self
+        while True:
+            axis = node.axis
+            if xy[axis] <= node.xy[axis]:
+                if node.left is None:
+                    node.left = KDNode[T](point, axis ^ 1)
+                    return
+                node = node.left
             else:
-                self.right.add(point)
+                if node.right is None:
+                    node.right = KDNode[T](point, axis ^ 1)
+                    return
+                node = node.right
                 
     def nearest(self, point: T) -> Tuple[Optional[T], float]:
         """
-        Gets the nearest point to a particular target point.
+        Gets the nearest point to a particular target point, out of this node and its descendants.
+        The search uses an explicit stack of nodes, each paired with the squared distance
+            to the splitting line that separates it from the target.
+        The nearer child is searched first, and the other is skipped if that line
+            is no closer than the best point found so far.
+        The search stops early if a node sits exactly on the target.
 
         Args:
             point (T): target point.
@@ -87,88 +253,66 @@ class KDNode(Generic[T]):
         Returns:
             Tuple[Optional[T], float]: point-distance tuple.
         """
-        next_branch:  Optional[KDNode[T]]
-        other_branch: Optional[KDNode[T]]
-        temp: Optional[T]
-
-        next_branch, other_branch = self._get_next_other_branch(point)
-        temp = self._get_temp_point(next_branch, point)
-        return self._backtrack(point, temp, other_branch)
-
-    def _get_next_other_branch(self, point: Pointable) -> Tuple[Optional[KDNode[T]], Optional[KDNode[T]]]:
-        """
-        There is no guarantee that the deepest node in the tree is the closest point.
-        As such, we need to do checks on some sibling nodes we encounter along the way.
-        This method returns two nodes, the first one being the more important branch,
-            which we will traverse all the way.
-        For the other branch, we would only need to check its root node.
-
-        Args:
-            point (Pointable): target point.
-
-        Returns:
-            Tuple[Optional[KDNode[T]], Optional[KDNode[T]]]: roots of the two child branches.
-        """
-        if getattr(point, self.level) < getattr(self.point, self.level):
-            return (self.left, self.right)
-        else:
-            return (self.right, self.left)
-
-    def _get_temp_point(self, next_branch: Optional[KDNode[T]], point: T) -> Optional[T]:
-        """
-        Processes the 'next_branch' to return a node if it exists.
-
-        Args:
-            next_branch (Optional[KDNode[T]]): branch to process.
-            point (T): target point.
-
-        Returns:
-            Optional[T]: a point if it exists.
-        """
-        if next_branch is not None:
-            return next_branch.nearest(point)[0]
-        else:
-            return None
-
-    def _backtrack(self, point: T, temp: Optional[T], other_branch: Optional[KDNode[T]]) -> Tuple[Optional[T], float]:
-        """
-        This method computes distances to all the other nodes that we have KIVed.
-        The minimum distance is the one that we output.
-
-        Args:
-            point (T): target point.
-            temp (Optional[T]): current closest point to target.
-            other_branch (Optional[KDNode[T]]): other branch to check for closest point.
-
-        Returns:
-            Tuple[Optional[Pointable], float]: point-distance tuple.
-        """
-        best:   Optional[T]
-        best_d: float
-        s_d:    float
-
-        best, best_d = point.get_closest_point(*[temp, self.point])
-        s_d = abs(getattr(point, self.level) - getattr(self.point, self.level))
-
-        if best_d >= s_d and other_branch is not None:
-            temp = other_branch.nearest(point)[0]
-            best, best_d = point.get_closest_point(*[temp, best])# if temp and best else (None, float("inf"))
-
-        return (best, best_d)
+        qx, qy = point.x, point.y
+        best = self.point
+        best_d2 = float("inf")
+        stack: List[Tuple[KDNode[T], float]] = [(self, 0.0)]
+        while stack:
+            node, plane_d2 = stack.pop()
+            if plane_d2 >= best_d2:
+                continue
+            x, y = node.xy
+            dx = qx - x
+            dy = qy - y
+            d2 = dx*dx + dy*dy
+            if d2 < best_d2:
+                best, best_d2 = node.point, d2
+                if d2 == 0.0:
+                    break
+            diff = dx if node.axis == XY.X else dy
+            if diff < 0:
+                near, far = node.left, node.right
+            else:
+                near, far = node.right, node.left
+            if far is not None:
+                stack.append((far, diff*diff))
+            if near is not None:
+                stack.append((near, plane_d2))
+        return point.get_closest_point(best)
 
 class KDTree(Generic[T]):
     """
     Encapsulates a KDTree object, containing many KDNode[T]s.
     At each depth level, we compare alternating coordinates, starting with x.
+
+    Queries run on a flattened copy of the tree, built lazily after any change.
+    The nodes are laid out in pre order as parallel arrays of coordinates, axes and child indices,
+        so that a search is index arithmetic over flat arrays instead of a walk through node objects.
+    Trees with only a few points skip the walk altogether and check every point at once with numpy.
     
     Fields:
         root (Optional[KDNode[T]]): the root of the tree.
         weight (int): the number of nodes in the tree.
         bound (Bound): the bounds that contain the entire collection of points.
+        _points (Optional[List[T]]): the points in pre order, or None if stale.
+        _xs (array): x-coordinate of each point.
+        _ys (array): y-coordinate of each point.
+        _axes (List[int]): axis each node splits on, 0 for x and 1 for y.
+        _lefts (List[int]): index of each node's left child, -1 if there is none.
+        _rights (List[int]): index of each node's right child, -1 if there is none.
     """
-    root: Optional[KDNode[T]]
-    weight: int
-    bound: Bound[T]
+    root:    Optional[KDNode[T]]
+    weight:  int
+    bound:   Bound[T]
+    _points: Optional[List[T]]
+    _xs:     array
+    _ys:     array
+    _axes:   List[int]
+    _lefts:  List[int]
+    _rights: List[int]
+
+    _BRUTE_FORCE_THRESHOLD = 256
+    _BRUTE_FORCE_CHUNK = 1024
 
     def __init__(self):
         """
@@ -178,6 +322,12 @@ class KDTree(Generic[T]):
         self.root = None
         self.weight = 0
         self.bound = Bound(float("inf"), float("-inf"), float("inf"), float("-inf"))
+        self._points = None
+        self._xs = array("d")
+        self._ys = array("d")
+        self._axes = []
+        self._lefts = []
+        self._rights = []
 
     def __str__(self) -> str:
         return str(self.in_order())
@@ -185,6 +335,43 @@ class KDTree(Generic[T]):
     def __repr__(self) -> str:
         return f"<KDTree: {self.bound}>"
 
+    @classmethod
+    def build(cls, points: List[T]) -> KDTree[T]:
+        """
+        Builds a balanced tree out of all the points at once.
+        The coordinates are stacked into a single array, and each median is picked out
+            with np.argpartition on the splitting axis instead of comparing points one by one.
+        The layout comes out in pre order, so the flattened arrays used by queries are filled in as well.
+
+        Args:
+            points (List[T]): the points to be added to the tree.
+
+        Returns:
+            KDTree[T]: the resulting tree.
+        """
+        tree = cls()
+        points = list(points)
+        if not points:
+            return tree
+        xy = np.array([(point.x, point.y) for point in points], dtype=np.float64)
+        order, axes, lefts, rights = _flat_layout(xy[:, 0], xy[:, 1])
+        nodes = [KDNode[T](points[i], axis) for i, axis in zip(order, axes)]
+        for node, left, right in zip(nodes, lefts, rights):
+            if left != -1:
+                node.left = nodes[left]
+            if right != -1:
+                node.right = nodes[right]
+        tree.root = nodes[0]
+        tree.weight = len(points)
+        min_x, min_y = xy.min(axis=0)
+        max_x, max_y = xy.max(axis=0)
+        tree.bound = Bound(float(min_x), float(max_x), float(min_y), float(max_y))
+        tree._xs = array("d", xy[order, 0].tolist())
+        tree._ys = array("d", xy[order, 1].tolist())
+        tree._axes, tree._lefts, tree._rights = axes, lefts, rights
+        tree._points = [node.point for node in nodes]
+        return tree
+
     @property
     def center(self) -> Tuple[float, float]:
         """
@@ -198,36 +385,56 @@ class KDTree(Generic[T]):
     def add_all(self, *points: T) -> None:
         """
         From a collection of points, add all of them to the tree.
-        It will check whether the root is None (assign root to this new node then).
-        If not None, then the point will be added to the tree's root, and passed along there.
-        Weights are also updated.
+        An empty tree is built straight from the points with KDTree.build.
+        Otherwise, the points are added to the root one by one, medians first,
+            so that the new points spread out evenly below the existing nodes.
+        Weights and bounds are also updated.
         
         Args:
             *points (T): the points to be added to the tree.
         """
-        sorted_points: List[T] = []
-        def append_median(_list: List[T], xy: str) -> None:
-            if len(_list) == 0:
-                return
-            left, mid, right = median_with_left_right(_list, comparator=lambda point: getattr(point, xy))
-            if mid is not None:
-                sorted_points.append(mid)
-            if xy == "x":
-                append_median(left, "y")
-                append_median(right, "y")
-            else:
-                append_median(left, "x")
-                append_median(right, "x")
-        append_median(list(points), "x")
-        
-        if not self.root:
-            self.root = KDNode[T](sorted_points.pop(0), "x")
-            self.weight += 1
-            
-        for point in sorted_points:
+        if not points:
+            return
+        if self.root is None:
+            tree = KDTree[T].build(points)
+            self.root, self.weight, self.bound = tree.root, tree.weight, tree.bound
+            self._xs, self._ys, self._axes, self._lefts, self._rights = tree._xs, tree._ys, tree._axes, tree._lefts, tree._rights
+            self._points = tree._points
+            return
+        xy = np.array([(point.x, point.y) for point in points], dtype=np.float64)
+        for i in _flat_layout(xy[:, 0], xy[:, 1])[0]:
+            point = points[i]
             self._remap_min_max(point)
             self.root.add(point)
-            self.weight += 1
+        self.weight += len(points)
+        self._points = None
+
+    def _flatten(self) -> List[T]:
+        """
+        Lays the tree out in pre order as flat arrays, if it has changed since the last layout.
+
+        Returns:
+            List[T]: the points in pre order.
+        """
+        if self._points is not None:
+            return self._points
+        nodes: List[KDNode[T]] = []
+        stack: List[KDNode[T]] = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+        index = {id(node): i for i, node in enumerate(nodes)}
+        self._xs = array("d", (node.xy[0] for node in nodes))
+        self._ys = array("d", (node.xy[1] for node in nodes))
+        self._axes = [node.axis for node in nodes]
+        self._lefts = [index[id(node.left)] if node.left else -1 for node in nodes]
+        self._rights = [index[id(node.right)] if node.right else -1 for node in nodes]
+        self._points = [node.point for node in nodes]
+        return self._points
 
     def _remap_min_max(self, point: T) -> None:
         """
@@ -236,15 +443,14 @@ class KDTree(Generic[T]):
         Args:
             point (T): point to be added.
         """
-        self.bound.min_x = min(self.bound.min_x, point.x)
-        self.bound.min_y = min(self.bound.min_y, point.y)
-        self.bound.max_x = max(self.bound.max_x, point.x)
-        self.bound.max_y = max(self.bound.max_y, point.y)
+        self.bound.extend_to(point.x, point.y)
         
     def nearest(self, point: T) -> Tuple[Optional[T], float]:
         """
         Finds the nearest point to the target.
-        The code passes the 'point' argument to the root, and lets the nodes handle it.
+        The search runs over the flattened arrays, comparing squared x-y distances.
+        The nearer child is searched first, and a farther child is skipped once
+            the splitting line is already further away than the best point so far.
         If an answer is unavailable, return (None, float('inf'))
 
         Args:
@@ -253,41 +459,100 @@ class KDTree(Generic[T]):
         Returns:
             Tuple[Optional[T], float]: point-distance tuple.
         """
-        if self.root == None:
+        points = self._flatten()
+        if not points:
             return (None, float("inf"))
-        return self.root.nearest(point)
+        if len(points) <= KDTree._BRUTE_FORCE_THRESHOLD:
+            best = int(_nearest_brute(point.x, point.y, self._xs, self._ys))
+        else:
+            best, _ = _nearest_flat(point.x, point.y, self._xs, self._ys, self._axes, self._lefts, self._rights)
+        return point.get_closest_point(points[best])
+
+    def nearest_batch(self, points: List[T]) -> List[Tuple[Optional[T], float]]:
+        """
+        Finds the nearest point to each of many targets.
+        The tree is flattened once, and every target is then searched over the same flat arrays.
+        For small trees, the targets are instead checked against every point in blocks,
+            one numpy call per block.
+
+        Args:
+            points (List[T]): points to be queried.
+
+        Returns:
+            List[Tuple[Optional[T], float]]: point-distance tuple for each target.
+        """
+        tree_points = self._flatten()
+        if not tree_points:
+            return [(None, float("inf")) for _ in points]
+        xs, ys, axes, lefts, rights = self._xs, self._ys, self._axes, self._lefts, self._rights
+        results: List[Tuple[Optional[T], float]] = []
+        if len(tree_points) <= KDTree._BRUTE_FORCE_THRESHOLD:
+            chunk = KDTree._BRUTE_FORCE_CHUNK
+            for start in range(0, len(points), chunk):
+                block = points[start:start+chunk]
+                qxs = np.fromiter((point.x for point in block), dtype=np.float64, count=len(block))
+                qys = np.fromiter((point.y for point in block), dtype=np.float64, count=len(block))
+                for point, best in zip(block, _nearest_brute(qxs, qys, xs, ys).tolist()):
+                    results.append(point.get_closest_point(tree_points[best]))
+            return results
+        for point in points:
+            best, _ = _nearest_flat(point.x, point.y, xs, ys, axes, lefts, rights)
+            results.append(point.get_closest_point(tree_points[best]))
+        return results
+
+    def iter_in_order(self) -> Iterator[T]:
+        """
+        In order traversal of the tree done with an explicit stack.
+        Points are yielded one at a time, so the caller can stop early.
+
+        Returns:
+            Iterator[T]: the points in the tree.
+        """
+        stack: List[KDNode[T]] = []
+        node = self.root
+        while node or stack:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.point
+            node = node.right
 
     def in_order(self) -> List[T]:
         """
-        In order traversal of the tree done by recursion.
+        In order traversal of the tree.
 
         Returns:
             List[T]: a list of points in the tree.
         """
-        L: List[T] = []
-        def in_order_helper(node: Optional[KDNode[T]]) -> None:
-            if not node:
-                return None
-            in_order_helper(node.left)
-            L.append(node.point)
-            in_order_helper(node.right)
-        in_order_helper(self.root)
-        return L
+        return list(self.iter_in_order())
+
+    def iter_pre_order(self) -> Iterator[T]:
+        """
+        Pre order traversal of the tree done with an explicit stack.
+        Points are yielded one at a time, so the caller can stop early.
 
-    def pre_order(self) -> List[Pointable]:
+        Returns:
+            Iterator[T]: the points in the tree.
+        """
+        stack: List[KDNode[T]] = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.point
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def pre_order(self) -> List[T]:
         """
-        Pre order traversal of the tree done by recursion.
+        Pre order traversal of the tree.
+        If the tree has been flattened since it last changed, the flattened points are
+            already in pre order and are copied over instead of walking the tree again.
 
         Returns:
-            List[Pointable]: a list of points in the tree.
-        """
-        L: List[Pointable] = []
-        def pre_order_helper(node: Optional[KDNode[T]]) -> None:
-            if not node:
-                return None
-            L.append(node.point)
-            pre_order_helper(node.left)
-            pre_order_helper(node.right)
-        pre_order_helper(self.root)
-        return L
-           
\ No newline at end of file
+            List[T]: the points in the tree.
+        """
+        if self._points is not None:
+            return list(self._points)
+        return list(self.iter_pre_order())
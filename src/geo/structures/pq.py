@@ -1,6 +1,6 @@
-from typing import Any, Generic, Optional, TypeVar
+import heapq
+from typing import Any, Generic, List, Optional, TypeVar
 
-from .avltree import AVLTree
 from .comparable import Comparable
 
 T = TypeVar("T", bound=Comparable)
@@ -8,22 +8,23 @@ T = TypeVar("T", bound=Comparable)
 class PriorityQueue(Generic[T]):
     """
     Encapsulates a PriorityQueue to enq and deq items in O(logN) time.
+    Backed by a binary heap kept in a plain list through heapq.
 
     Fields:
-        tree (AVLTree[T]): the tree to keep track of the items.
+        heap (List[T]): the items, in heap order.
     """
-    tree: AVLTree[T]
+    heap: List[T]
     
     def __init__(self):
-        self.tree = AVLTree[T]()
+        self.heap = []
         
     def is_empty(self) -> bool:
-        return self.tree.root == None
+        return not self.heap
     
     def enq(self, val: T) -> None:
-        self.tree.insert(val)
+        heapq.heappush(self.heap, val)
         
     def deq(self) -> Optional[T]:
-        min_val: Optional[T] = self.tree.get_min_value()
-        self.tree.delete(min_val)
-        return min_val
\ No newline at end of file
+        if not self.heap:
+            return None
+        return heapq.heappop(self.heap)
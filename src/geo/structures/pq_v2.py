@@ -1,5 +1,6 @@
-from .avltree import AVLTree
-from typing import Any, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+import heapq
+from itertools import count
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, TypeVar
 
 from .comparable import Comparable
 
@@ -9,47 +10,52 @@ U = TypeVar("U")
 class PriorityQueue(Generic[U, T]):
     """
     Encapsulates a PriorityQueue to enq and deq items in O(logN) time.
+    Backed by a binary heap of [key, order, value, valid] entries kept in a plain list through heapq.
+    The order breaks ties between equal keys, with the most recently enqueued value coming out first,
+        and means that the values themselves are never compared.
+    Updated values are not removed from the heap, but have their old entry marked invalid,
+        to be skipped when it reaches the top.
 
     Fields:
-        tree (AVLTree[T]): the tree to keep track of the items.
+        heap (List[List[Any]]): the entries, in heap order.
+        entries (Dict[U, List[Any]]): the latest entry of each value.
+        comparator (Callable[[U], T]): maps a value to its key.
     """
-    tree: AVLTree[T]
-    keys: Dict[T, List[U]]
-    reverse_keys: Dict[U, T]
+    heap: List[List[Any]]
+    entries: Dict[U, List[Any]]
     comparator: Callable[[U], T]
+    _order: Iterator[int]
     
     def __init__(self, comparator: Callable[[U], T]):
-        self.tree = AVLTree[T]()
-        self.keys = {}
-        self.reverse_keys = {}
+        self.heap = []
+        self.entries = {}
         self.comparator = comparator
+        self._order = count(0, -1)
         
     def is_empty(self) -> bool:
-        return self.tree.root is None
+        self._discard_invalid()
+        return not self.heap
     
     def enq(self, value: U) -> None:
-        key = self.comparator(value)
-        if key not in self.keys:
-            self.keys[key] = [value]
-        else:
-            self.keys[key].append(value)
-        self.tree.insert(key)
-        self.reverse_keys[value] = key
+        entry = [self.comparator(value), next(self._order), value, True]
+        self.entries[value] = entry
+        heapq.heappush(self.heap, entry)
     
     def deq(self) -> Optional[U]:
-        key = self.tree.get_min_value()
-        if key is None:
-            return
-        self.tree.delete(key)
-        return self.keys[key].pop()
+        self._discard_invalid()
+        if not self.heap:
+            return None
+        entry = heapq.heappop(self.heap)
+        value = entry[2]
+        if self.entries.get(value) is entry:
+            del self.entries[value]
+        return value
     
     def update(self, value: U) -> None:
-        key = self.comparator(value)
-        if value in self.reverse_keys:
-            old_key = self.reverse_keys[value]
-            self.keys[old_key].remove(value)
-            self.reverse_keys[value] = key
-            self.tree.delete(key)
+        if value in self.entries:
+            self.entries[value][3] = False
         self.enq(value)
-        
-            
\ No newline at end of file
+
+    def _discard_invalid(self) -> None:
+        while self.heap and not self.heap[0][3]:
+            heapq.heappop(self.heap)
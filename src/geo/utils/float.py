@@ -1,10 +1,34 @@
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
+import warnings
 
-def is_float(x: Optional[Any]):
-    if not x:
-        return False
+def try_float(x: Optional[Any]) -> Tuple[bool, float]:
+    """
+    Attempts to convert a value into a float, so that checking and converting is done in one go.
+
+    Args:
+        x (Optional[Any]): value to be converted.
+
+    Returns:
+        Tuple[bool, float]: whether the conversion succeeded, and the converted value (0.0 if it did not).
+    """
     try:
-        y = float(x)
-        return True
-    except ValueError:
-        return False
\ No newline at end of file
+        return True, float(x)
+    except (TypeError, ValueError):
+        return False, 0.0
+
+def is_float(x: Optional[Any]) -> bool:
+    """
+    Checks whether a value can be converted into a float.
+    Zero counts as a float, but booleans do not.
+    Deprecated, as try_float checks and converts in one go.
+
+    Args:
+        x (Optional[Any]): value to be checked.
+
+    Returns:
+        bool: whether the value can be converted into a float.
+    """
+    warnings.warn("is_float is deprecated, use try_float instead", DeprecationWarning, stacklevel=2)
+    if x is None or isinstance(x, bool):
+        return False
+    return try_float(x)[0]
@@ -0,0 +1,51 @@
+import random
+
+import numpy as np
+from shapely import geometry
+
+from geo.structures.bounds_tree import BoundsTree
+
+def _overlapping_shapes(seed):
+    rand = random.Random(seed)
+    shapes, values = [], []
+    for i in range(60):
+        x, y = rand.uniform(0, 8), rand.uniform(0, 8)
+        w, h = rand.uniform(1, 4), rand.uniform(1, 4)
+        if i % 2:
+            shapes.append(geometry.box(x, y, x+w, y+h))
+        else:
+            shapes.append(geometry.Polygon([(x, y), (x+w, y), (x, y+h)]))
+        values.append(i)
+    return shapes, values
+
+def _assert_batch_matches_single(tree, shapes, seed):
+    rng = np.random.default_rng(seed)
+    xs, ys = rng.uniform(0, 12, 500), rng.uniform(0, 12, 500)
+    points = [geometry.Point(x, y) for x, y in zip(xs, ys)]
+    assert any(sum(shape.contains(point) for shape in shapes) > 1 for point in points)
+    assert tree.find_shapes(xs, ys) == [tree.find_shape(point) for point in points]
+
+def test_find_shapes_matches_find_shape_on_overlaps():
+    for seed in range(5):
+        shapes, values = _overlapping_shapes(seed)
+        _assert_batch_matches_single(BoundsTree.build(shapes, values), shapes, seed)
+
+def test_find_shapes_matches_find_shape_on_overlaps_after_add():
+    for seed in range(5):
+        shapes, values = _overlapping_shapes(seed)
+        tree = BoundsTree()
+        for shape, value in zip(shapes, values):
+            tree.add(shape, value)
+        _assert_batch_matches_single(tree, shapes, seed)
+
+def test_small_sorted_batches_stay_balanced():
+    shapes = [geometry.box(i, 0, i+1, 1) for i in range(500)]
+    tree = BoundsTree()
+    for i, shape in enumerate(shapes):
+        tree.add_all([shape], [i])
+    def height(node):
+        return 0 if node is None else 1 + max(height(node.left), height(node.right))
+    assert tree.weight == 500
+    assert height(tree.root) <= np.log(500) / np.log(1 / BoundsTree._BALANCE) + 1
+    xs = np.arange(500) + 0.5
+    assert tree.find_shapes(xs, np.full(500, 0.5)) == list(range(500))
@@ -0,0 +1,25 @@
+import random
+
+from geo.geom.geo_pt import GeoPt
+from geo.structures.avltree import AVLTree
+from geo.structures.kdtree import KDTree
+
+def test_avltree_traversals_return_lists():
+    rand = random.Random(0)
+    keys = [rand.randint(0, 1000) for _ in range(200)]
+    tree = AVLTree()
+    for key in keys:
+        tree.insert(key)
+    assert isinstance(tree.in_order(), list)
+    assert tree.in_order() == sorted(set(keys))
+    assert tree.in_order() == list(tree.iter_in_order())
+    assert tree.pre_order() == list(tree.iter_pre_order())
+
+def test_kdtree_traversals_return_lists():
+    rand = random.Random(0)
+    points = [GeoPt(1.3+rand.random()*0.1, 103.8+rand.random()*0.1) for _ in range(300)]
+    tree = KDTree.build(points)
+    assert isinstance(tree.in_order(), list)
+    assert sorted(map(id, tree.in_order())) == sorted(map(id, points))
+    assert tree.in_order() == list(tree.iter_in_order())
+    assert tree.pre_order() == list(tree.iter_pre_order())